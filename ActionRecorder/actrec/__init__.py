@@ -35,6 +35,9 @@ def on_load(dummy=None):
     context = bpy.context
     ActRec_pref = get_preferences(context)
     ActRec_pref.operators_list_length = 0
+    functions.resize_tracked_actions(ActRec_pref.tracked_operators_size)
+    functions.clear_rna_index()
+    shared_data.report_cursor = 0
     # load local actions
     if bpy.data.filepath == "":
         try:
@@ -61,6 +64,10 @@ def on_load(dummy=None):
         except json.JSONDecodeError as err:
             log.logger.info("old scene-data couldn't be parsed (%s)" % err)
     functions.load_local_action(ActRec_pref, json.loads(context.scene.ar.local))
+    functions.clear_plan_cache()
+    functions.cancel_all_sessions()
+    functions.profiles.clear()
+    functions.invalidate_trigger_index()
 
     # update paths
     ActRec_pref.storage_path = ActRec_pref.storage_path
@@ -90,6 +97,7 @@ def register():
     handlers.depsgraph_update_post.append(functions.track_scene)
     handlers.load_post.append(on_load)
     handlers.depsgraph_update_post.append(check_on_load)
+    functions.register_triggers()
 
     bpy.types.Scene.ar = PointerProperty(type=properties.AR_scene_data)
 
@@ -115,6 +123,7 @@ def unregister():
     handlers.load_post.remove(on_load)
     if check_on_load in bpy.app.handlers.depsgraph_update_post:
         handlers.depsgraph_update_post.remove(check_on_load)
+    functions.unregister_triggers()
 
     del bpy.types.Scene.ar
     log.logger.info("Unregistered Action Recorder")
@@ -32,9 +32,10 @@ from .locals import (
 from .macros import (
     get_local_macro_index,
     add_report_as_macro,
-    get_report_text,
+    read_new_reports,
     split_context_report,
     create_object_copy,
+    clear_rna_index,
     improve_context_report,
     split_operator_report,
     evaluate_operator,
@@ -42,10 +43,53 @@ from .macros import (
     dict_to_kwarg_str,
     track_scene,
     merge_report_tracked,
+    resize_tracked_actions,
+    capture_record_reports,
+    get_snapshot_record_data,
     compare_op_dict,
     convert_value_to_python
 )
 
+from .plan import (
+    get_plan,
+    clear_plan_cache
+)
+
+from .codegen import (
+    generate_module
+)
+
+from .optimizer import (
+    Rewrite,
+    optimize_macros,
+    apply_rewrites
+)
+
+from .profiler import (
+    PlaybackProfile,
+    profiles
+)
+
+from .triggers import (
+    TRIGGERS,
+    invalidate_trigger_index,
+    register_triggers,
+    unregister_triggers
+)
+
+from .playback import (
+    PlaybackSession,
+    checkpoints,
+    skipped_writes,
+    play,
+    resume,
+    execute_render_complete,
+    get_session,
+    get_undo_mode,
+    is_playback_running,
+    cancel_all_sessions
+)
+
 from .shared import (
     check_for_duplicates,
     add_data_to_collection,
@@ -54,12 +98,11 @@ from .shared import (
     property_to_python,
     apply_data_to_item,
     get_name_of_command,
+    split_context_assignment,
     update_command,
-    play,
     get_font_path,
     split_and_keep,
     text_to_lines,
-    execute_render_complete,
     enum_list_id_to_name_dict,
     enum_items_to_enum_prop_list,
     install_packages,
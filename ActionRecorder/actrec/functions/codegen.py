@@ -0,0 +1,313 @@
+# region Imports
+# external modules
+import keyword
+import builtins
+from datetime import datetime
+from contextlib import suppress
+
+# blender modules
+from bpy.types import PropertyGroup
+from typing import TYPE_CHECKING
+
+# relative imports
+from .plan import ExecutionPlan, PlanStep, compile_plan, compile_command, get_script_filename
+from .shared import update_command
+if TYPE_CHECKING:
+    from ..properties.shared import AR_action
+else:
+    AR_action = PropertyGroup
+# endregion
+
+# region Code Generation
+
+# code of the generated module, which is placed before the action functions
+MODULE_HEADER = '''"""
+Actions generated by Action Recorder on %s: %s
+
+The module runs without the Action Recorder add-on, e.g. on a render farm:
+    blender -b <file.blend> --python <this file>
+"""
+import time
+
+import bpy
+from mathutils import Vector, Matrix, Color, Euler, Quaternion
+
+
+def get_override(context, ui_type):
+    """get the override of the first area with the given ui_type, empty in background mode"""
+    for window in context.window_manager.windows:
+        for area in window.screen.areas:
+            if area.ui_type != ui_type:
+                continue
+            for region in area.regions:
+                if region.type == 'WINDOW':
+                    return {'window': window, 'screen': window.screen, 'area': area, 'region': region}
+    return {}
+
+
+def each_selected_object(context):
+    """select and activate one of the selected objects after another, the selection is restored at the end"""
+    selected_objects = context.selected_objects[:]
+    for object in selected_objects:
+        object.select_set(False)
+    try:
+        for object in selected_objects:
+            object.select_set(True)
+            context.view_layer.objects.active = object
+            yield object
+            object.select_set(False)
+    finally:
+        for object in selected_objects:
+            object.select_set(True)
+
+
+def select_objects(context, objects, active_object, keep_selection):
+    """select the given objects, equal to the "Select Object" event"""
+    view_layer = context.view_layer
+    if not keep_selection:
+        for object in view_layer.objects:
+            object.select_set(False)
+    for name in objects:
+        if object := view_layer.objects.get(name):
+            object.select_set(True)
+    if active_object == "":
+        return
+    object = view_layer.objects.get(active_object)
+    if object is None:
+        raise RuntimeError("%%s Object doesn't exist in the active view layer" %% active_object)
+    view_layer.objects.active = object
+    object.select_set(True)
+'''
+
+
+def escape_docstring(text: str) -> str:
+    """
+    escape a label for a docstring of the generated module
+
+    Args:
+        text (str): label to escape
+
+    Returns:
+        str: label without backslashes or double quotes that could end the docstring
+    """
+    return " ".join(text.replace("\\", "\\\\").replace('"', "'").splitlines())
+
+
+def get_function_name(label: str, used_names: set) -> str:
+    """
+    convert the label of an action to a unique python function name
+
+    Args:
+        label (str): label of the action
+        used_names (set): function names which are already used, the new name is added
+
+    Returns:
+        str: function name
+    """
+    name = "".join(x if x.isalnum() else "_" for x in label.lower()).strip("_") or "action"
+    name = "action_%s" % name if name[0].isdigit() or keyword.iskeyword(name) else name
+    unique_name = name
+    i = 1
+    while unique_name in used_names:
+        unique_name = "%s_%i" % (name, i)
+        i += 1
+    used_names.add(unique_name)
+    return unique_name
+
+
+class ActionWriter:
+    """lowers the execution plan of an action to the lines of a python function"""
+
+    def __init__(self, action: AR_action, name: str) -> None:
+        self.action = action
+        self.name = name
+        self.plan: ExecutionPlan = compile_plan(action.macros)
+        self.lines = []
+        # initialisers of the script namespaces, which are kept for the whole action
+        self.namespaces = []
+        # initialisers of the loop counters, which are kept until the next object (execution mode "OBJECT")
+        self.counters = []
+        # macro labels (=value) accessed by the macro id (=key)
+        self.labels = {macro.id: macro.label for macro in action.macros}
+
+    def write(self) -> list[str]:
+        """
+        generate the function of the action
+
+        Returns:
+            list[str]: lines of the function
+        """
+        self.lines = []
+        self.namespaces = []
+        self.counters = []
+        indent = 2 if self.action.execution_mode == "OBJECT" else 1
+        if not len(self.plan):
+            self.add("pass", indent)
+        self.write_steps(0, len(self.plan), indent)
+        body = self.lines
+        self.lines = [
+            "def %s(context=None):" % self.name,
+            '    """%s"""' % escape_docstring(self.action.label),
+            "    context = context or bpy.context"
+        ]
+        for line in self.namespaces:
+            self.add(line, 1)
+        if self.action.execution_mode == "OBJECT":
+            self.add("for object in each_selected_object(context):", 1)
+        if self.counters:
+            self.add("# loop counters aren't reset when a loop ends, equal to the playback", indent)
+        for line in self.counters:
+            self.add(line, indent)
+        self.lines.extend(body)
+        return self.lines
+
+    def add(self, line: str, indent: int) -> None:
+        self.lines.append("%s%s" % ("    " * indent, line))
+
+    def write_steps(self, start: int, end: int, indent: int) -> None:
+        """
+        write the steps between start and end, loops are written as nested blocks
+
+        Args:
+            start (int): index of the first step
+            end (int): index after the last step
+            indent (int): indentation level of the steps
+        """
+        i = start
+        while i < end:
+            step = self.plan.steps[i]
+            self.add("# %s" % self.labels.get(step.macro_id, step.macro_id), indent)
+            if step.event == 'Loop' and i in self.plan.loop_end:
+                self.write_loop(step, indent)
+                i = self.plan.loop_end[i] + 1
+                continue
+            if step.event:
+                self.write_event(step, indent)
+            else:
+                self.write_command(step, indent)
+            i += 1
+
+    def write_loop(self, step: PlanStep, indent: int) -> None:
+        """
+        write the loop of the given step and its body,
+        the counter of the loop continues in the next pass of an outer loop like in the playback
+
+        Args:
+            step (PlanStep): "Loop" step
+            indent (int): indentation level of the loop
+        """
+        data = step.data
+        end = self.plan.loop_end[step.index]
+        counter = "loop_counter_%i" % step.index
+        if data['StatementType'] == 'python':
+            if step.error:
+                self.add("raise RuntimeError(%r)" % str(step.error), indent)
+                return
+            self.counters.append("%s = 0" % counter)
+            self.add("while True:", indent)
+            self.add("loop_counter = %s" % counter, indent + 1)
+            self.add("if not (%s):" % data['PyStatement'].strip(), indent + 1)
+            self.add("break", indent + 2)
+            self.add("%s += 1" % counter, indent + 1)
+        elif data['StatementType'] == 'count':
+            # DEPRECATED count loop, same number of iterations as the playback
+            self.counters.append("%s = %r" % (counter, data.get("Startnumber", 0)))
+            self.add("while %s < %r:" % (counter, data["Endnumber"]), indent)
+            self.add("%s += %r" % (counter, data["Stepnumber"]), indent + 1)
+        else:
+            self.counters.append("%s = 0" % counter)
+            self.add("while %s < %r:" % (counter, data["RepeatCount"]), indent)
+            self.add("%s += 1" % counter, indent + 1)
+        self.write_steps(step.index + 1, end, indent + 1)
+
+    def write_event(self, step: PlanStep, indent: int) -> None:
+        """
+        write the code of an event
+
+        Args:
+            step (PlanStep): event step
+            indent (int): indentation level of the event
+        """
+        data = step.data
+        if step.event == 'Timer':
+            self.add("time.sleep(%r)" % data['Time'], indent)
+        elif step.event == 'Render Complete':
+            self.add("# the render operators finish before they return in background mode", indent)
+        elif step.event == 'Select Object':
+            self.add("select_objects(context, %r, %r, %r)" % (
+                data.get('Objects', []), data.get('Object', ""), data.get('KeepSelection', False)), indent)
+        elif step.event == 'Run Script':
+            if step.error:
+                self.add("raise RuntimeError(%r)" % str(step.error), indent)
+                return
+            filename = get_script_filename(step)
+            namespace = "script_namespace_%i" % step.index
+            if data.get('KeepNamespace', False):
+                self.namespaces.append("%s = {'__name__': %r}" % (namespace, filename))
+                namespace_code = namespace
+            else:
+                namespace_code = "{'__name__': %r}" % filename
+            self.add("exec(compile(%r, %r, 'exec'), %s)" % (data['ScriptText'], filename, namespace_code), indent)
+        elif step.event in ('Loop', 'EndLoop'):
+            self.add("# skipped, the loop is incomplete", indent)
+
+    def write_command(self, step: PlanStep, indent: int) -> None:
+        """
+        write a command with the same execution context and ui_type as the playback
+
+        Args:
+            step (PlanStep): command step
+            indent (int): indentation level of the command
+        """
+        if step.error:
+            self.add("raise RuntimeError(%r)" % str(step.error), indent)
+            return
+        macro = self.action.macros.get(step.macro_id)
+        command = step.compiled.source
+        if macro.command.startswith("bpy.ops.ar."):
+            self.add("# skipped, requires the Action Recorder add-on: %s" % macro.command, indent)
+            return
+        if macro.command.startswith("bpy.ops.") and (updated_command := update_command(macro.command)):
+            # only pass on the properties the operator of the current Blender version supports
+            with suppress(SyntaxError):
+                command = compile_command(updated_command, macro.operator_execution_context).source
+        if step.ui_type:
+            self.add("with context.temp_override(**get_override(context, %r)):" % step.ui_type, indent)
+            indent += 1
+        if self.action.execution_mode == "INDIVIDUAL":
+            self.add("for object in each_selected_object(context):", indent)
+            indent += 1
+        self.add(command, indent)
+
+
+def generate_module(actions: list[AR_action]) -> str:
+    """
+    generate a standalone python module with one function per action,
+    loops and events are lowered to plain python, calling the module plays all actions in order
+
+    Args:
+        actions (list[AR_action]): actions to convert
+
+    Returns:
+        str: source of the module
+    """
+    lines = [MODULE_HEADER % (
+        datetime.now().strftime('%d-%m-%Y %H:%M:%S'),
+        ", ".join(escape_docstring(action.label) for action in actions)
+    )]
+    used_names = set(dir(builtins)) | {"time", "bpy", "get_override", "each_selected_object", "select_objects"}
+    names = []
+    for action in actions:
+        name = get_function_name(action.label, used_names)
+        names.append(name)
+        lines.append("")
+        lines.extend(ActionWriter(action, name).write())
+        lines.append("")
+    lines.append("")
+    lines.append('if __name__ == "__main__":')
+    lines.extend("    %s()" % name for name in names)
+    if not names:
+        lines.append("    pass")
+    return "\n".join(lines) + "\n"
+
+# endregion
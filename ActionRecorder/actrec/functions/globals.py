@@ -63,7 +63,9 @@ def save(ActRec_pref: AR_preferences) -> None:
             "macros.is_available",
             "macros.is_playing",
             "macros.alert",
-            "is_playing"
+            "is_playing",
+            "has_checkpoint",
+            "progress"
         ]
     )
 
@@ -1,6 +1,9 @@
 # region Imports
 # external modules
-from typing import Tuple, Union
+from typing import Tuple, Union, Optional
+from contextlib import contextmanager
+from collections import deque
+import sys
 import mathutils
 from typing import TYPE_CHECKING
 
@@ -95,6 +98,29 @@ def executed_operator_to_dict(ops: Operator) -> dict:
     return data
 
 
+def get_operator_fingerprint(ops: Operator) -> Optional[tuple]:
+    """
+    identifies an executed operator and the state of its properties without converting all properties,
+    changes if the operator is redone with other properties
+
+    Args:
+        ops (Operator): executed operator
+
+    Returns:
+        Optional[tuple]: format (pointer, bl_idname, properties), None if the properties can't be read
+    """
+    try:
+        items = ops.properties.items()
+    except (AttributeError, TypeError):
+        return None
+    # only the set properties are stored as ID properties, groups and arrays are converted to comparable values
+    properties = repr([
+        (key, value.to_dict() if hasattr(value, 'to_dict') else value.to_list() if hasattr(value, 'to_list') else value)
+        for key, value in items
+    ])
+    return ops.as_pointer(), ops.bl_idname, properties
+
+
 @persistent
 def track_scene(dummy: Scene = None) -> None:
     """
@@ -103,8 +129,16 @@ def track_scene(dummy: Scene = None) -> None:
     Args:
         dummy (Scene, optional): unused. Defaults to None.
     """
+    if shared_data.playback_depth:
+        # the operators of the playback aren't recorded
+        return
     context = bpy.context
     ActRec_pref = get_preferences(context)
+    if (ActRec_pref.local_record_macros
+            and ActRec_pref.record_engine == 'SNAPSHOT'
+            and get_info_override(context) is not None
+            and has_new_reports(context)):
+        capture_record_reports(context)
     operators = context.window_manager.operators
     length = len(operators)
     if not length:
@@ -115,8 +149,11 @@ def track_scene(dummy: Scene = None) -> None:
         ActRec_pref.operators_list_length = length
         op = operators[-1]
         shared_data.tracked_actions.append(
-            ['REGISTER' in op.bl_options, 'UNDO' in op.bl_options, op.bl_idname, executed_operator_to_dict(op)]
+            ('REGISTER' in op.bl_options, 'UNDO' in op.bl_options, sys.intern(op.bl_idname),
+             executed_operator_to_dict(op))
         )
+        shared_data.operator_fingerprint = get_operator_fingerprint(op)
+        shared_data.tracking_counts['serialized'] += 1
         return
 
     len_tracked = len(shared_data.tracked_actions)
@@ -129,41 +166,135 @@ def track_scene(dummy: Scene = None) -> None:
         i += 1
         op = operators[-i]
     last_register_op = last_tracked = shared_data.tracked_actions[-1]
-    i = 1
-    while last_register_op[2] != op.bl_idname and len_tracked > i:
-        i += 1
-        last_register_op = shared_data.tracked_actions[-i]
-    props = executed_operator_to_dict(op)
-    if last_register_op[2] == op.bl_idname and props != last_register_op[3]:
-        last_register_op[3] = props
+    fingerprint = get_operator_fingerprint(op)
+    if fingerprint is not None and fingerprint == shared_data.operator_fingerprint:
+        # the operator is unchanged since its last conversion, the update is a property change
+        shared_data.tracking_counts['unchanged'] += 1
+        props = None
+    else:
+        shared_data.operator_fingerprint = fingerprint
+        shared_data.tracking_counts['serialized'] += 1
+        i = 1
+        while last_register_op[2] != op.bl_idname and len_tracked > i:
+            i += 1
+            last_register_op = shared_data.tracked_actions[-i]
+        props = executed_operator_to_dict(op)
+    if props is not None and last_register_op[2] == op.bl_idname and props != last_register_op[3]:
+        shared_data.tracked_actions[-i] = (*last_register_op[:3], props)
     else:
         if last_tracked[2] == "CONTEXT":
-            last_tracked[3] += 1
+            shared_data.tracked_actions[-1] = (True, True, "CONTEXT", last_tracked[3] + 1)
         else:
-            shared_data.tracked_actions.append([True, True, "CONTEXT", 1])
+            shared_data.tracked_actions.append((True, True, "CONTEXT", 1))
+
+
+def resize_tracked_actions(size: int) -> None:
+    """
+    change the capacity of the tracked operators, the oldest operators are dropped if they don't fit
+
+    Args:
+        size (int): maximal number of tracked operators
+    """
+    if shared_data.tracked_actions.maxlen != size:
+        shared_data.tracked_actions = deque(shared_data.tracked_actions, maxlen=size)
 
 
-def get_report_text(context: Context) -> str:
+def get_info_override(context: Context) -> Optional[dict]:
     """
-    extract all reports from Blender
+    get an override of an open Info editor
 
     Args:
         context (Context): active blender context
 
     Returns:
-        str: report text
+        Optional[dict]: temp_override arguments, None if no Info editor is open
+    """
+    for window in context.window_manager.windows:
+        for area in window.screen.areas:
+            if area.type != 'INFO':
+                continue
+            for region in area.regions:
+                if region.type == 'WINDOW':
+                    return {'window': window, 'screen': window.screen, 'area': area, 'region': region}
+    return None
+
+
+@contextmanager
+def info_context(context: Context):
+    """
+    execute the info operators inside an open Info editor,
+    the active area is only switched to the Info editor if no Info editor is open
+
+    Args:
+        context (Context): active blender context
     """
+    override = get_info_override(context)
+    if override is not None:
+        with context.temp_override(**override):
+            yield
+        return
     with context.temp_override():
         area_type = context.area.type
-        clipboard_data = context.window_manager.clipboard
         context.area.type = 'INFO'
-        bpy.ops.info.select_all(action='SELECT')
+        try:
+            yield
+        finally:
+            context.area.type = area_type
+
+
+def has_new_reports(context: Context) -> bool:
+    """
+    check if reports were added since the last read, without reading them
+
+    Args:
+        context (Context): active blender context
+
+    Returns:
+        bool: new reports exist or the reports were cleared
+    """
+    with info_context(context):
+        cursor = shared_data.report_cursor
+        new_reports = (
+            bpy.ops.info.select_pick(report_index=cursor, extend=True) != {'CANCELLED'}
+            # reports were deleted, see read_new_reports
+            or cursor and bpy.ops.info.select_pick(report_index=cursor - 1, extend=True) == {'CANCELLED'}
+        )
+        bpy.ops.info.select_all(action='DESELECT')
+    return bool(new_reports)
+
+
+def read_new_reports(context: Context, copy: bool = True) -> list[str]:
+    """
+    read the reports which were added since the last read,
+    only the new reports are selected and copied (the clipboard is restored afterwards)
+
+    Args:
+        context (Context): active blender context
+        copy (bool, optional): return the new reports, otherwise they are only marked as read. Defaults to True.
+
+    Returns:
+        list[str]: lines of the new reports
+    """
+    with info_context(context):
+        start = shared_data.report_cursor
+        if start and bpy.ops.info.select_pick(report_index=start - 1, extend=True) == {'CANCELLED'}:
+            # reports were deleted, the cursor is behind the end of the reports, all remaining reports are new
+            start = 0
+        bpy.ops.info.select_all(action='DESELECT')
+        end = start
+        # select_pick is cancelled for an index behind the last report
+        while bpy.ops.info.select_pick(report_index=end, extend=True) != {'CANCELLED'}:
+            end += 1
+        shared_data.report_cursor = end
+        if not copy or end == start:
+            bpy.ops.info.select_all(action='DESELECT')
+            return []
+        clipboard_data = context.window_manager.clipboard
         bpy.ops.info.report_copy()
         bpy.ops.info.select_all(action='DESELECT')
-        report_text = context.window_manager.clipboard
-        context.area.type = area_type
-        context.window_manager.clipboard = clipboard_data
-    return report_text
+    report_text = context.window_manager.clipboard
+    context.window_manager.clipboard = clipboard_data
+    return report_text.splitlines()
 
 
 def compare_fstr_float(fstr: str, fnum: float) -> bool:
@@ -348,7 +479,7 @@ def merge_report_tracked(reports: list, tracked_actions: list) -> list[tuple]:
     Args:
         reports (list): reports from Blender
         tracked_actions (list): tracked actions from scene
-            Element format: [isRegistered: bool, isUndo: bool, Operator(_OT_): str, parameters: dict]
+            Element format: (isRegistered: bool, isUndo: bool, Operator(_OT_): str, parameters: dict)
 
     Returns:
         list[tuple]:
@@ -363,7 +494,10 @@ def merge_report_tracked(reports: list, tracked_actions: list) -> list[tuple]:
     # calculate operator
     continue_report = len_report > report_i
     continue_tracked = len_tracked > tracked_i
-    tracked = [True, True, "CONTEXT", 1]
+    tracked = (True, True, "CONTEXT", 1)
+    # the tracked elements are immutable, the remaining count of the current "CONTEXT" element is kept here
+    context_i = -1
+    context_count = 0
     logger.info("reports: %s\ntracked:%s" % (reports, tracked_actions))
     while continue_report or continue_tracked:
         if continue_report:
@@ -423,8 +557,11 @@ def merge_report_tracked(reports: list, tracked_actions: list) -> list[tuple]:
                 data.append((0, True, undo, source_path, attribute, value))
                 report_i += 1
             if tracked[2] == 'CONTEXT':
-                tracked[3] -= 1
-            tracked_i += (tracked[2] == 'CONTEXT' and tracked[3] == 0) or (not continue_report or not tracked[0])
+                if context_i != tracked_i:
+                    context_i = tracked_i
+                    context_count = tracked[3]
+                context_count -= 1
+            tracked_i += (tracked[2] == 'CONTEXT' and context_count == 0) or (not continue_report or not tracked[0])
         else:
             report_i += 1
             if not continue_report:
@@ -552,15 +689,138 @@ def trace_collection(base: Struct, path: str) -> Struct:
     return base
 
 
-def get_copy_of_object(data: dict, obj: Struct, attribute: str, depth=5) -> dict:
+# rna structs (=value) derived from the struct with the identifier (=key), None if the index needs to be rebuilt
+rna_subtypes: Optional[dict[str, list]] = None
+# remaining depth can reach the attribute (=value) accessed by the (struct identifier, attribute, depth) (=key)
+rna_reachable: dict[tuple[str, str, int], bool] = {}
+# pointer and collection properties, which can lead to the attribute (=value)
+# accessed by the (struct identifier, attribute, depth) (=key)
+rna_attribute_paths: dict[tuple[str, str, int], tuple[str, ...]] = {}
+
+
+def clear_rna_index() -> None:
+    """
+    rebuild the rna index on the next copy, e.g. after add-ons registered new types
+    """
+    global rna_subtypes
+    rna_subtypes = None
+    rna_reachable.clear()
+    rna_attribute_paths.clear()
+
+
+def get_rna_family(rna: Struct) -> list[Struct]:
+    """
+    get the given rna struct and all structs derived from it,
+    a pointer property of the type can reference any of these structs
+
+    Args:
+        rna (Struct): rna definition of the struct
+
+    Returns:
+        list[Struct]: rna definitions of the struct and its subtypes
     """
-    makes a copy of a given blender object
+    global rna_subtypes
+    if rna_subtypes is None:
+        rna_subtypes = {}
+        for name in dir(bpy.types):
+            sub_rna = getattr(getattr(bpy.types, name, None), 'bl_rna', None)
+            base = getattr(sub_rna, 'base', None)
+            if base is not None:
+                rna_subtypes.setdefault(base.identifier, []).append(sub_rna)
+    family = [rna]
+    for sub_rna in family:
+        family.extend(rna_subtypes.get(sub_rna.identifier, []))
+    return family
+
+
+def get_property_target(prop) -> Optional[Struct]:
+    """
+    get the rna struct of the value of a pointer or collection property
+
+    Args:
+        prop (Property): rna definition of the property
+
+    Returns:
+        Optional[Struct]: rna struct of the value, None if the value isn't traversed
+    """
+    if prop.type == 'POINTER':
+        return prop.fixed_type
+    if prop.type == 'COLLECTION':
+        # the collection itself is traversed, which only has the properties of its srna
+        return prop.srna
+    return None
+
+
+def can_reach_attribute(rna: Struct, attribute: str, depth: int) -> bool:
+    """
+    check if an object of the given rna struct or one of its subtypes
+    can lead to the attribute within the given depth
+
+    Args:
+        rna (Struct): rna definition of the object
+        attribute (str): attribute to search for
+        depth (int): remaining depth of the copy
+
+    Returns:
+        bool: attribute can be reached
+    """
+    if depth <= 0:
+        return False
+    key = (rna.identifier, attribute, depth)
+    if key in rna_reachable:
+        return rna_reachable[key]
+    # cycles of the rna types end, because the depth decreases with each step
+    family = get_rna_family(rna)
+    reachable = any(
+        sub_rna.properties.get(attribute) is not None
+        or hasattr(getattr(bpy.types, sub_rna.identifier, None), attribute)
+        for sub_rna in family
+    )
+    if not reachable and depth > 1:
+        reachable = any(
+            (target := get_property_target(prop)) is not None and can_reach_attribute(target, attribute, depth - 1)
+            for sub_rna in family
+            for prop in sub_rna.properties[1:]
+        )
+    rna_reachable[key] = reachable
+    return reachable
+
+
+def get_attribute_paths(rna: Struct, attribute: str, depth: int) -> tuple[str, ...]:
+    """
+    get the pointer and collection properties of the rna struct, which can lead to the attribute
+
+    Args:
+        rna (Struct): rna definition of the object
+        attribute (str): attribute to search for
+        depth (int): remaining depth of the copy
+
+    Returns:
+        tuple[str, ...]: identifiers of the properties
+    """
+    key = (rna.identifier, attribute, depth)
+    paths = rna_attribute_paths.get(key)
+    if paths is None:
+        paths = rna_attribute_paths[key] = tuple(
+            prop.identifier
+            for prop in rna.properties[1:]
+            if (target := get_property_target(prop)) is not None and can_reach_attribute(target, attribute, depth - 1)
+        )
+    return paths
+
+
+def get_copy_of_object(data: dict, obj: Struct, attribute: str, depth=5, visited: Optional[dict] = None) -> dict:
+    """
+    makes a copy of a given blender object,
+    only the properties which can lead to the attribute are copied and each struct is copied once
 
     Args:
         data (dict): data to write part of the copy to
         obj (Struct): object to work on
         attribute (str): attribute of the object
         depth (int, optional): depth where to break the copy of the object. Defaults to 5.
+        visited (Optional[dict], optional): remaining depth (=value) accessed by the pointer (=key)
+            of the already copied structs. Defaults to None.
 
     Returns:
         dict: copied blender object
@@ -571,16 +831,21 @@ def get_copy_of_object(data: dict, obj: Struct, attribute: str, depth=5) -> dict
         return {attribute: getattr(obj, attribute)}
     if not hasattr(obj, 'bl_rna'):
         return data
-    for prop in obj.bl_rna.properties[1:]:
-        if not (prop.type == 'COLLECTION' or prop.type == 'POINTER'):
-            continue
-        sub_obj = getattr(obj, prop.identifier)
+    if visited is None:
+        visited = {}
+    if hasattr(obj, 'as_pointer'):
+        pointer = obj.as_pointer()
+        if visited.get(pointer, 0) >= depth:
+            return data
+        visited[pointer] = depth
+    for identifier in get_attribute_paths(obj.bl_rna, attribute, depth):
+        sub_obj = getattr(obj, identifier)
         if obj == sub_obj:
             continue
-        res = get_copy_of_object({}, sub_obj, attribute, depth - 1)
+        res = get_copy_of_object({}, sub_obj, attribute, depth - 1, visited)
         if res == {}:
             continue
-        data[prop.identifier] = res
+        data[identifier] = res
     return data
 
 
@@ -630,7 +895,9 @@ def compare_object_report(
     if obj is None:
         return
     
-    if hasattr(obj, attribute) and getattr(obj, attribute) != copy_dict[attribute]:
+    if (hasattr(obj, attribute)
+            and attribute in copy_dict
+            and convert_value_to_python(getattr(obj, attribute)) != convert_value_to_python(copy_dict[attribute])):
         return (obj.__class__, ".".join(source_path), attribute, value)
     for key in copy_dict:
         if not hasattr(obj, key):
@@ -785,4 +1052,112 @@ def improve_operator_report(
     }
     return mapping.get(op_type, {}).get(op_name, default)
 
+
+def freeze_object_copy(copy_dict: dict) -> dict:
+    """
+    convert the values of an object copy to python values,
+    which don't change with the Blender data (e.g. mathutils.Vector)
+
+    Args:
+        copy_dict (dict): copy created with create_object_copy
+
+    Returns:
+        dict: converted copy
+    """
+    return {
+        key: freeze_object_copy(value) if isinstance(value, dict) else convert_value_to_python(value)
+        for key, value in copy_dict.items()
+    }
+
+
+# replaces the value of the changed attribute in the copy of a first change, see mark_first_change
+FIRST_CHANGE = object()
+
+
+def mark_first_change(copy_dict: dict, attribute: str) -> dict:
+    """
+    prepare the copy of the first change of a property, there is no copy of the state before the change.
+    if a single path of the copy leads to the attribute, its value is replaced by FIRST_CHANGE
+    so the path compares as changed, otherwise the copy is empty and the report keeps its path
+
+    Args:
+        copy_dict (dict): copy created with create_object_copy after the change
+        attribute (str): changed attribute
+
+    Returns:
+        dict: copy to compare the report against
+    """
+    paths = []
+    stack = [((), copy_dict)]
+    while stack:
+        path, data = stack.pop()
+        for key, value in data.items():
+            if isinstance(value, dict):
+                stack.append(((*path, key), value))
+            elif key == attribute:
+                paths.append(path)
+    if len(paths) != 1:
+        return {}
+    marked = {attribute: FIRST_CHANGE}
+    for key in reversed(paths[0]):
+        marked = {key: marked}
+    return marked
+
+
+def capture_record_reports(context: Context) -> None:
+    """
+    read the new reports of a recording (record engine "SNAPSHOT")
+    and improve the context reports while the data is in the state right after the change.
+    a snapshot of the changed property is kept, it is the state before the next change of the same property,
+    only the reported paths are copied, see get_copy_of_object
+
+    Args:
+        context (Context): active blender context
+    """
+    for report in read_new_reports(context):
+        if not report.startswith('bpy.'):
+            continue
+        improved = None
+        if report.startswith('bpy.context.'):
+            source_path, attribute, value = split_context_report(report)
+            key = (".".join(source_path), attribute)
+            copy_dict = shared_data.snapshot_cache.get(key)
+            current = freeze_object_copy(create_object_copy(context, source_path, attribute))
+            if copy_dict is None:
+                # first change of the property
+                copy_dict = mark_first_change(current, attribute)
+            improved = improve_context_report(context, copy_dict, source_path, attribute, value)
+            shared_data.snapshot_cache[key] = current
+        shared_data.snapshot_reports.append((report, improved))
+
+
+def get_snapshot_record_data(context: Context) -> list[str]:
+    """
+    merge the captured reports of a recording (record engine "SNAPSHOT") with the tracked operators
+    and clear the captured reports
+
+    Args:
+        context (Context): active blender context
+
+    Returns:
+        list[str]: commands of the recording
+    """
+    snapshot_reports = list(shared_data.snapshot_reports)
+    shared_data.snapshot_reports.clear()
+    shared_data.snapshot_cache.clear()
+    if not snapshot_reports:
+        return []
+    # merge_report_tracked returns the context reports in the order of the reports
+    improved_reports = iter([improved for report, improved in snapshot_reports if improved is not None])
+    data = []
+    merged = merge_report_tracked([report for report, improved in snapshot_reports], shared_data.tracked_actions)
+    logger.info("Record Reports: %s", merged)
+    for bpy_type, register, undo, parent, name, value in merged:
+        if bpy_type == 0:
+            data.append(next(improved_reports, None) or "bpy.context.%s.%s = %s" % (".".join(parent), name, value))
+        elif register:
+            evaluation = evaluate_operator(parent, name, value)
+            data.append(improve_operator_report(context, parent, name, value, evaluation))
+    return data
+
 # endregion
@@ -0,0 +1,255 @@
+# region Imports
+# external modules
+from typing import Optional, NamedTuple, Callable, Union
+import ast
+
+# blender modules
+from bpy.types import CollectionProperty
+
+# relative imports
+from .plan import EVENT_PREFIX, split_operator_call
+from .shared import split_context_assignment
+# endregion
+
+# region Optimizer
+
+
+class Rewrite(NamedTuple):
+    """change of a macro proposed by the optimizer"""
+    # "REMOVE": the macro is deleted, "REPLACE": the command of the macro is replaced
+    kind: str
+    index: int
+    command: Optional[str]
+    reason: str
+
+
+def add_vectors(value1: Union[tuple, float], value2: Union[tuple, float]) -> Union[tuple, float]:
+    """
+    add two transform values, the command contains the exact sum
+
+    Args:
+        value1 (Union[tuple, float]): first value
+        value2 (Union[tuple, float]): second value
+
+    Returns:
+        Union[tuple, float]: sum of the values
+    """
+    if isinstance(value1, tuple):
+        return tuple(x + y for x, y in zip(value1, value2))
+    return value1 + value2
+
+
+# function to combine the "value" of two consecutive transforms (=value) accessed by the operator (=key),
+# rotate and resize aren't additive, their pivot (e.g. the bounding box center) moves with the transform
+TRANSFORM_COMBINERS: dict[str, Callable] = {
+    'transform.translate': add_vectors
+}
+# transform settings which make two consecutive transforms depend on the geometry in between
+NON_ADDITIVE_TRANSFORM_SETTINGS = {'use_proportional_edit', 'snap', 'center_override', 'use_automerge_and_split'}
+# selection actions which overwrite the whole selection, the selection before doesn't matter
+SELECTION_OVERWRITES = {'SELECT', 'DESELECT'}
+
+
+class OptimizerMacro:
+    """working copy of a macro while the optimizer passes run"""
+    __slots__ = ("index", "command", "original_command", "ui_type", "execution_context", "removed",
+                 "reason", "operator", "kwargs", "assignment")
+
+    def __init__(self, index: int, macro) -> None:
+        self.index = index
+        self.command = self.original_command = macro.command
+        self.ui_type = macro.ui_type
+        self.execution_context = macro.operator_execution_context
+        self.removed = False
+        self.reason = ""
+        # "<type>.<name>" of literal operator commands, None otherwise
+        self.operator = None
+        self.kwargs = {}
+        # left side of literal context assignments, None otherwise
+        self.assignment = None
+        if not macro.active or self.command.startswith(EVENT_PREFIX):
+            return
+        if split := split_operator_call(self.command):
+            op_type, op_name, self.kwargs = split
+            self.operator = "%s.%s" % (op_type, op_name)
+        elif split := split_context_assignment(self.command):
+            try:
+                ast.literal_eval(split[2])
+            except (ValueError, TypeError, SyntaxError, MemoryError, RecursionError):
+                return
+            self.assignment = self.command.split(" = ")[0]
+
+    def is_compatible(self, other: 'OptimizerMacro') -> bool:
+        """
+        check if both macros are executed in the same way and can be combined
+
+        Args:
+            other (OptimizerMacro): following macro
+
+        Returns:
+            bool: both macros use the same ui_type and execution context
+        """
+        return self.ui_type == other.ui_type and self.execution_context == other.execution_context
+
+    def remove(self, reason: str) -> None:
+        """
+        mark the macro as removed
+
+        Args:
+            reason (str): reason shown in the preview
+        """
+        self.removed = True
+        self.reason = reason
+
+
+def is_additive(kwargs: dict) -> bool:
+    """
+    check if consecutive transforms with these settings add up to a single transform
+
+    Args:
+        kwargs (dict): settings of the transform without the value
+
+    Returns:
+        bool: no proportional editing, snapping or other geometry dependent setting is used
+    """
+    return not any(
+        value for key, value in kwargs.items()
+        if key in NON_ADDITIVE_TRANSFORM_SETTINGS or key.startswith("use_snap_")
+    )
+
+
+def merge_transforms(macros: list[OptimizerMacro]) -> bool:
+    """
+    merge consecutive transforms of the same operator and settings into a single transform
+
+    Args:
+        macros (list[OptimizerMacro]): macros which aren't removed
+
+    Returns:
+        bool: any macro was changed
+    """
+    changed = False
+    for macro, following in zip(macros, macros[1:]):
+        if (macro.removed
+                or macro.operator not in TRANSFORM_COMBINERS
+                or macro.operator != following.operator
+                or not macro.is_compatible(following)):
+            continue
+        kwargs, following_kwargs = dict(macro.kwargs), dict(following.kwargs)
+        value, following_value = kwargs.pop('value', None), following_kwargs.pop('value', None)
+        if value is None or following_value is None or kwargs != following_kwargs or not is_additive(kwargs):
+            continue
+        following.kwargs['value'] = TRANSFORM_COMBINERS[macro.operator](value, following_value)
+        following.command = "bpy.ops.%s(%s)" % (
+            following.operator,
+            ", ".join("%s=%r" % (key, value) for key, value in following.kwargs.items())
+        )
+        following.reason = "merged with the previous %s" % macro.operator
+        macro.remove("merged into the following %s" % macro.operator)
+        changed = True
+    return changed
+
+
+def remove_overwritten_selections(macros: list[OptimizerMacro]) -> bool:
+    """
+    remove select_all operators which are overwritten by the following select_all,
+    two following inverts cancel each other out
+
+    Args:
+        macros (list[OptimizerMacro]): macros which aren't removed
+
+    Returns:
+        bool: any macro was removed
+    """
+    changed = False
+    for macro, following in zip(macros, macros[1:]):
+        if (macro.removed
+                or not macro.operator
+                or not macro.operator.endswith(".select_all")
+                or macro.operator != following.operator
+                or not macro.is_compatible(following)):
+            continue
+        action = macro.kwargs.get('action', 'TOGGLE')
+        following_action = following.kwargs.get('action', 'TOGGLE')
+        if following_action in SELECTION_OVERWRITES:
+            macro.remove("overwritten by the following selection")
+            changed = True
+        elif action == following_action == 'INVERT':
+            macro.remove("cancelled out by the following invert")
+            following.remove("cancelled out by the previous invert")
+            changed = True
+    return changed
+
+
+def remove_dead_stores(macros: list[OptimizerMacro]) -> bool:
+    """
+    remove context assignments which are overwritten by the directly following assignment to the same target,
+    any other macro in between could use the value, e.g. an assignment through an index that was set before
+
+    Args:
+        macros (list[OptimizerMacro]): macros which aren't removed
+
+    Returns:
+        bool: any macro was removed
+    """
+    changed = False
+    for macro, following in zip(macros, macros[1:]):
+        if (macro.removed
+                or macro.assignment is None
+                or following.assignment != macro.assignment
+                or not macro.is_compatible(following)):
+            continue
+        macro.remove("overwritten by the following assignment")
+        changed = True
+    return changed
+
+
+# optimizer passes, executed in this order until no pass changes a macro
+PASSES = (merge_transforms, remove_overwritten_selections, remove_dead_stores)
+
+
+def optimize_macros(macros: CollectionProperty, start: int = 0) -> list[Rewrite]:
+    """
+    find the redundant macros of an action, which can be removed or merged without changing the result,
+    the macros aren't changed, see apply_rewrites
+
+    Args:
+        macros (CollectionProperty): macros of the action
+        start (int, optional): index of the first macro to optimize, e.g. the first recorded macro. Defaults to 0.
+
+    Returns:
+        list[Rewrite]: changes ordered by the macro index
+    """
+    working = [OptimizerMacro(index, macro) for index, macro in enumerate(macros) if index >= start]
+    changed = True
+    while changed:
+        alive = [macro for macro in working if not macro.removed]
+        changed = False
+        for optimizer_pass in PASSES:
+            changed |= optimizer_pass(alive)
+            alive = [macro for macro in alive if not macro.removed]
+    rewrites = []
+    for macro in working:
+        if macro.removed:
+            rewrites.append(Rewrite('REMOVE', macro.index, None, macro.reason))
+        elif macro.command != macro.original_command:
+            rewrites.append(Rewrite('REPLACE', macro.index, macro.command, macro.reason))
+    return rewrites
+
+
+def apply_rewrites(macros: CollectionProperty, rewrites: list[Rewrite]) -> None:
+    """
+    apply the changes of optimize_macros to the macros
+
+    Args:
+        macros (CollectionProperty): macros of the action, unchanged since optimize_macros
+        rewrites (list[Rewrite]): changes to apply
+    """
+    for rewrite in rewrites:
+        if rewrite.kind == 'REPLACE':
+            macros[rewrite.index].command = rewrite.command
+    for rewrite in reversed(rewrites):
+        if rewrite.kind == 'REMOVE':
+            macros.remove(rewrite.index)
+
+# endregion
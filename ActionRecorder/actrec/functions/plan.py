@@ -0,0 +1,531 @@
+# region Imports
+# external modules
+from typing import Optional, Union, NamedTuple
+from bisect import bisect_left
+import ast
+import re
+import json
+import functools
+import math
+# mathutils types are available inside the executed commands
+from mathutils import Vector, Matrix, Color, Euler, Quaternion
+
+# blender modules
+import bpy
+from bpy.types import CollectionProperty, Context
+
+# relative imports
+from ..log import logger
+from .shared import extract_properties, split_context_assignment
+from .macros import convert_value_to_python
+# endregion
+
+# region Compiled Commands
+
+# names which are available inside executed commands, "context" is added on execution
+command_namespace = {
+    'bpy': bpy,
+    'Vector': Vector,
+    'Matrix': Matrix,
+    'Color': Color,
+    'Euler': Euler,
+    'Quaternion': Quaternion
+}
+
+
+class CompiledCommand:
+    """
+    command which is ready for execution,
+    either a resolved operator with evaluated keyword arguments or a compiled code object
+    """
+    __slots__ = ("source", "execution_context", "operator", "kwargs", "code", "assignment", "target")
+
+    def __init__(self, source: str, execution_context: str) -> None:
+        self.source = source
+        self.execution_context = execution_context
+        self.operator = None
+        self.kwargs = {}
+        self.code = None
+        # literal assignment to the active object, format: (path, prop, index, value)
+        self.assignment = None
+        # literal assignment to a context attribute, format: (attributes, prop, index, value)
+        self.target = None
+
+    def run(self, context: Context) -> None:
+        """
+        execute the command
+
+        Args:
+            context (Context): active blender context, accessible as "context" inside the command
+        """
+        if self.operator is not None:
+            self.operator(self.execution_context, **self.kwargs)
+        else:
+            exec(self.code, {**command_namespace, 'context': context})
+
+    def assign(self, object: bpy.types.Object) -> None:
+        """
+        apply the assignment of the command to the given object instead of the active object
+
+        Args:
+            object (bpy.types.Object): object to apply the assignment to
+        """
+        path, prop, index, value = self.assignment
+        for attribute in path:
+            object = getattr(object, attribute)
+        if index is None:
+            setattr(object, prop, value)
+        else:
+            getattr(object, prop)[index] = value
+
+    def is_unchanged(self, data: Union[Context, bpy.types.Object], skip: int = 0) -> bool:
+        """
+        check if the assignment of the command would set the value which is already set,
+        floats are compared with the precision of a float property
+
+        Args:
+            data (Union[Context, bpy.types.Object]): context or object the target attributes start from
+            skip (int, optional): number of leading target attributes to skip, e.g. 1 to start at the object.
+                Defaults to 0.
+
+        Returns:
+            bool: value is unchanged, False if the command has no target or the value can't be compared
+        """
+        if self.target is None:
+            return False
+        attributes, prop, index, value = self.target
+        try:
+            for attribute, key in attributes[skip:]:
+                data = getattr(data, attribute)
+                if key is not None:
+                    data = data[key]
+            current = getattr(data, prop)
+            if index is not None:
+                current = current[index]
+            return is_same_value(value, convert_value_to_python(current))
+        except (AttributeError, KeyError, IndexError, TypeError, ValueError):
+            return False
+
+
+def is_same_value(value, current) -> bool:
+    """
+    compare a literal value with the current value of a property,
+    matrices and multi-dimensional arrays aren't compared
+
+    Args:
+        value (any): literal value of the command
+        current (any): current value, converted with convert_value_to_python
+
+    Returns:
+        bool: both values are equal, floats within the precision of a float property
+    """
+    if isinstance(current, tuple):
+        return (isinstance(value, tuple)
+                and len(value) == len(current)
+                and all(not isinstance(x, tuple) and is_same_value(v, x) for v, x in zip(value, current)))
+    if isinstance(current, float):
+        return (isinstance(value, (int, float))
+                and not isinstance(value, bool)
+                and math.isclose(current, value, rel_tol=1e-6, abs_tol=1e-7))
+    return type(value) is type(current) and value == current
+
+
+def split_operator_call(command: str) -> Optional[tuple]:
+    """
+    split an operator command into the operator type, name and its keyword arguments,
+    only possible if all arguments are python literals
+
+    Args:
+        command (str): command in the format bpy.ops.<type>.<name>(<kwargs>)
+
+    Returns:
+        Optional[tuple]: format (type, name, kwargs), None if the command can't be split
+    """
+    try:
+        node = ast.parse(command, mode='eval').body
+    except SyntaxError:
+        return None
+    if not isinstance(node, ast.Call) or node.args:
+        return None
+    path = []
+    func = node.func
+    while isinstance(func, ast.Attribute):
+        path.append(func.attr)
+        func = func.value
+    if not (isinstance(func, ast.Name) and func.id == 'bpy' and len(path) == 3 and path[2] == 'ops'):
+        return None
+    kwargs = {}
+    for keyword in node.keywords:
+        if keyword.arg is None:
+            return None
+        try:
+            kwargs[keyword.arg] = ast.literal_eval(keyword.value)
+        except (ValueError, TypeError, SyntaxError, MemoryError, RecursionError):
+            return None
+    return path[1], path[0], kwargs
+
+
+def resolve_operator_call(command: str) -> Optional[tuple]:
+    """
+    resolve an operator command to the operator and its keyword arguments,
+    only possible if all arguments are python literals
+
+    Args:
+        command (str): command in the format bpy.ops.<type>.<name>(<kwargs>)
+
+    Returns:
+        Optional[tuple]: format (operator, kwargs), None if the command can't be resolved
+    """
+    split = split_operator_call(command)
+    if split is None:
+        return None
+    op_type, op_name, kwargs = split
+    return getattr(getattr(bpy.ops, op_type), op_name), kwargs
+
+
+# attribute with an optional int or str subscript, e.g. modifiers["Subdivision"]
+ATTRIBUTE_PATTERN = re.compile(r"(\w+)(?:\[(-?\d+|\"[^\"]*\"|'[^']*')\])?")
+
+
+def resolve_context_target(command: str) -> Optional[tuple]:
+    """
+    resolve a context command, which assigns a literal to an attribute or array element of a context member
+
+    Args:
+        command (str): command in the format bpy.context.<path>.<prop>[<index>] = <literal>
+
+    Returns:
+        Optional[tuple]: format (attributes, prop, index, value),
+            attributes in the format ((name, key), ...) with key None if the attribute has no subscript,
+            None if the command can't be resolved
+    """
+    assignment = split_context_assignment(command)
+    if assignment is None:
+        return None
+    path, prop, value = assignment
+    if not path:
+        return None
+    attributes = []
+    for part in path:
+        if not (match := ATTRIBUTE_PATTERN.fullmatch(part)):
+            return None
+        attributes.append((match[1], None if match[2] is None else ast.literal_eval(match[2])))
+    index = None
+    if match := re.fullmatch(r"(\w+)\[(-?\d+)\]", prop):
+        prop, index = match[1], int(match[2])
+    elif not prop.isidentifier():
+        return None
+    try:
+        value = ast.literal_eval(value)
+    except (ValueError, TypeError, SyntaxError, MemoryError, RecursionError):
+        return None
+    return tuple(attributes), prop, index, value
+
+
+# context attributes which point to the active object
+OBJECT_CONTEXT_ATTRIBUTES = {"object", "active_object"}
+
+
+def resolve_object_assignment(command: str) -> Optional[tuple]:
+    """
+    resolve a context command, which assigns a literal to an attribute or array element of the active object
+
+    Args:
+        command (str): command in the format bpy.context.object.<path>.<prop>[<index>] = <literal>
+
+    Returns:
+        Optional[tuple]: format (path, prop, index, value), None if the command can't be resolved
+    """
+    assignment = split_context_assignment(command)
+    if assignment is None:
+        return None
+    path, prop, value = assignment
+    if not path or path[0] not in OBJECT_CONTEXT_ATTRIBUTES or not all(x.isidentifier() for x in path[1:]):
+        return None
+    index = None
+    if match := re.fullmatch(r"(\w+)\[(-?\d+)\]", prop):
+        prop, index = match[1], int(match[2])
+    elif not prop.isidentifier():
+        return None
+    try:
+        value = ast.literal_eval(value)
+    except (ValueError, TypeError, SyntaxError, MemoryError, RecursionError):
+        return None
+    return tuple(path[1:]), prop, index, value
+
+
+@functools.lru_cache(maxsize=512)
+def compile_command(command: str, execution_context: str) -> CompiledCommand:
+    """
+    compile a macro command for the execution, the result is cached (LRU) by command and execution context.
+    operator commands inject the execution context, context commands get executed on the "context" variable
+
+    Args:
+        command (str): command of the macro
+        execution_context (str): execution context of operator commands
+
+    Raises:
+        SyntaxError: the command couldn't be compiled
+
+    Returns:
+        CompiledCommand: command ready for execution
+    """
+    if command.startswith("bpy.ops."):
+        split = command.split("(")
+        source = "%s(\"%s\", %s" % (split[0], execution_context, "(".join(split[1:]))
+        compiled = CompiledCommand(source, execution_context)
+        resolved = resolve_operator_call(command)
+        if resolved:
+            compiled.operator, compiled.kwargs = resolved
+            return compiled
+    else:
+        source = command.replace("bpy.context.", "context.") if command.startswith("bpy.context.") else command
+        compiled = CompiledCommand(source, execution_context)
+        compiled.assignment = resolve_object_assignment(command)
+        compiled.target = resolve_context_target(command)
+    compiled.code = compile(source, "<ActRec macro>", 'exec')
+    return compiled
+
+
+@functools.lru_cache(maxsize=64)
+def compile_script(script_text: str, filename: str):
+    """
+    compile the script of a "Run Script" event, the result is cached (LRU) by the script text and name
+
+    Args:
+        script_text (str): source of the script
+        filename (str): name of the script, shown in tracebacks
+
+    Raises:
+        SyntaxError: the script couldn't be compiled
+
+    Returns:
+        CodeType: compiled script
+    """
+    return compile(script_text, filename, 'exec')
+
+
+def get_script_filename(step: "PlanStep") -> str:
+    """
+    get the name of the script of a "Run Script" step, which is used as filename in tracebacks
+
+    Args:
+        step (PlanStep): "Run Script" step
+
+    Returns:
+        str: name of the script, the macro id if the script has no name
+    """
+    return step.data.get('ScriptName') or step.macro_id
+
+# endregion
+
+# region Execution Plan
+
+EVENT_PREFIX = "ar.event"
+
+
+class PlanStep:
+    """single prepared macro of an execution plan"""
+    __slots__ = ("index", "macro_id", "event", "data", "command", "compiled", "code", "ui_type", "error")
+
+    def __init__(self, index: int, macro_id: str, ui_type: str) -> None:
+        self.index = index
+        self.macro_id = macro_id
+        self.ui_type = ui_type
+        # type of the event or None if the macro is a command
+        self.event = None
+        # parsed json payload of the event
+        self.data = {}
+        # command with injected execution context
+        self.command = ""
+        # command ready for execution
+        self.compiled: Optional[CompiledCommand] = None
+        # compiled python code of the event, condition of a python loop or script of a Run Script event
+        self.code = None
+        # error which is reported when this step get executed
+        self.error: Union[str, Exception, None] = None
+
+
+class PlanDiagnostic(NamedTuple):
+    """problem of a single step found while compiling a plan"""
+    index: int
+    macro_id: str
+    message: str
+
+
+class ExecutionPlan:
+    """
+    compiled version of the active macros of an action,
+    contains the parsed events, prepared commands and the loop jump table
+    """
+
+    def __init__(self, steps: list[PlanStep]) -> None:
+        self.steps = steps
+        # table to point from the start-loop step (=key) to the end-loop step (=value)
+        self.loop_end = {}
+        # table to point from the end-loop step (=key) to the start-loop step (=value)
+        self.loop_start = {}
+        # number of steps inside the loop (=value) accessed by the start-loop step (=key)
+        self.loop_size = {}
+        # problems found while compiling the plan, e.g. unbalanced loops
+        self.diagnostics: list[PlanDiagnostic] = []
+        # indices of all "Render Complete" steps, sorted
+        self.render_complete = [step.index for step in steps if step.event == 'Render Complete']
+        self.match_loops()
+
+    def __len__(self) -> int:
+        return len(self.steps)
+
+    def match_loops(self) -> None:
+        """
+        creates the loop jump tables by matching every Loop step with its EndLoop step in a single pass,
+        unbalanced Loop and EndLoop steps are added to the diagnostics
+        """
+        open_loops = []
+        for step in self.steps:
+            if step.event == 'Loop':
+                open_loops.append(step)
+            elif step.event == 'EndLoop':
+                if not open_loops:
+                    self.diagnostics.append(PlanDiagnostic(
+                        step.index, step.macro_id, "EndLoop without matching Loop, the macro is skipped"
+                    ))
+                    continue
+                start_step = open_loops.pop()
+                self.loop_end[start_step.index] = step.index
+                self.loop_start[step.index] = start_step.index
+                self.loop_size[start_step.index] = step.index - start_step.index - 1
+        for step in open_loops:
+            self.diagnostics.append(PlanDiagnostic(
+                step.index, step.macro_id, "Loop without matching EndLoop, the macro is skipped"
+            ))
+        self.diagnostics.sort(key=lambda diagnostic: diagnostic.index)
+
+    def next_render_complete(self, start_index: int) -> Optional[int]:
+        """
+        get the first "Render Complete" step at or after the given index
+
+        Args:
+            start_index (int): index to start the search from
+
+        Returns:
+            Optional[int]: index of the step, None if no step follows
+        """
+        i = bisect_left(self.render_complete, start_index)
+        if i < len(self.render_complete):
+            return self.render_complete[i]
+        return None
+
+
+def compile_step(index: int, macro) -> PlanStep:
+    """
+    parse and prepare a single macro for the execution
+
+    Args:
+        index (int): index of the macro inside the plan
+        macro (AR_macro): macro to compile
+
+    Returns:
+        PlanStep: prepared step
+    """
+    command = macro.command
+    step = PlanStep(index, macro.id, macro.ui_type)
+
+    split = command.split(":")
+    if split[0] == EVENT_PREFIX:
+        step.data = json.loads(":".join(split[1:]))
+        step.event = step.data['Type']
+        if step.event == 'Loop' and step.data['StatementType'] == 'python':
+            try:
+                step.code = compile(step.data["PyStatement"], "<ActRec loop %s>" % macro.id, 'eval')
+            except SyntaxError as err:
+                step.error = "Loop condition of macro %s: %s" % (macro.id, err)
+        elif step.event == 'Run Script':
+            try:
+                step.code = compile_script(step.data['ScriptText'], get_script_filename(step))
+            except SyntaxError as err:
+                step.error = "Script of macro %s: %s" % (macro.id, err)
+        return step
+
+    step.command = command
+    if (command.startswith("bpy.ops.ar.local_play")
+            and set(extract_properties(command.split("(")[1][: -1])) == {"id=\"\"", "index=-1"}):
+        step.error = "Don't run Local Play with default properties, this may cause recursion"
+        return step
+    # the execution context is only used by operator commands, share the cache for all others
+    execution_context = macro.operator_execution_context if command.startswith("bpy.ops.") else ""
+    try:
+        step.compiled = compile_command(command, execution_context)
+        step.command = step.compiled.source
+    except SyntaxError as err:
+        step.error = err
+    return step
+
+
+def compile_plan(macros: CollectionProperty) -> ExecutionPlan:
+    """
+    compile the active macros into an execution plan
+
+    Args:
+        macros (CollectionProperty): macros to compile
+
+    Returns:
+        ExecutionPlan: compiled plan
+    """
+    return ExecutionPlan([
+        compile_step(i, macro) for i, macro in enumerate(macro for macro in macros if macro.active)
+    ])
+
+
+def get_macros_digest(macros: CollectionProperty) -> int:
+    """
+    content hash of the macros, changes if a command, the active state or the order of the macros changes
+
+    Args:
+        macros (CollectionProperty): macros to hash
+
+    Returns:
+        int: hash of the macros
+    """
+    return hash(tuple(
+        (macro.id, macro.command, macro.active, macro.operator_execution_context, macro.ui_type)
+        for macro in macros
+    ))
+
+
+# compiled plans (=value) accessed by the action type and id (=key), value format: (digest, plan)
+plan_cache = {}
+
+
+def get_plan(action_type: str, action_id: str, macros: CollectionProperty) -> ExecutionPlan:
+    """
+    get the execution plan of the given macros,
+    the plan is only compiled again if the macros changed
+
+    Args:
+        action_type (str): action type of the action the macros belong to
+        action_id (str): id of the action the macros belong to
+        macros (CollectionProperty): macros to get the plan from
+
+    Returns:
+        ExecutionPlan: compiled plan of the macros
+    """
+    digest = get_macros_digest(macros)
+    cached = plan_cache.get((action_type, action_id))
+    if cached and cached[0] == digest:
+        return cached[1]
+    plan = compile_plan(macros)
+    for diagnostic in plan.diagnostics:
+        logger.warning("action %s, macro %i (%s): %s" % (
+            action_id, diagnostic.index, diagnostic.macro_id, diagnostic.message))
+    plan_cache[(action_type, action_id)] = (digest, plan)
+    return plan
+
+
+def clear_plan_cache() -> None:
+    """
+    removes all compiled plans
+    """
+    plan_cache.clear()
+
+# endregion
@@ -0,0 +1,981 @@
+# region Imports
+# external modules
+from typing import Optional, Union
+from contextlib import suppress
+import os
+import uuid
+import linecache
+import time
+import functools
+import traceback
+from typing import TYPE_CHECKING
+
+# blender modules
+import bpy
+from bpy.app.handlers import persistent
+from bpy.types import CollectionProperty, Context, PropertyGroup
+
+# relative imports
+from ..log import logger
+from .. import shared_data
+from .plan import ExecutionPlan, PlanStep, CompiledCommand, command_namespace, get_plan, get_script_filename
+from .profiler import PlaybackProfile, profiles
+from .shared import get_preferences
+if TYPE_CHECKING:
+    from ..properties.shared import AR_action
+else:
+    AR_action = PropertyGroup
+# endregion
+
+__module__ = __package__.split(".")[0]
+
+# region Playback Session
+
+
+class PlaybackSession:
+    """
+    state of a single playback of an action.
+    every playback owns its cursor, loop iterators, pending timers and error,
+    therefore multiple playbacks (e.g. nested or timer resumed) don't interfere with each other
+    """
+
+    def __init__(self, action: AR_action, action_type: str, plan: ExecutionPlan, start_index: int = 0) -> None:
+        self.id = uuid.uuid1().hex
+        self.action_type = action_type
+        self.action_id = action.id
+        # key of the state of the action, format: (action type, action id),
+        # the local and global copy of an action have the same id
+        self.action_key = (action_type, action.id)
+        self.plan = plan
+        self.start_index = start_index
+        # index of the next step to execute
+        self.cursor = start_index
+        # iterator (=value) of a loop accessed by the id of the start-loop macro (=key)
+        self.loop_iterator = {}
+        # namespaces (=value) of "Run Script" events which keep their variables, accessed by the macro id (=key)
+        self.script_namespaces = {}
+        # namespace to evaluate the conditions of python loops, reused for every evaluation
+        self.loop_namespace = {**command_namespace, 'context': None, 'loop_counter': 0}
+        # timer functions registered to resume this session
+        self.timers = []
+        # index of the "Render Complete" step the session waits for
+        self.render_index: Optional[int] = None
+        self.error: Union[Exception, str, None] = None
+        self.finished = False
+        # time in seconds the session may run before it yields to Blender, None runs until the end (blocking)
+        self.budget: Optional[float] = None
+        # True while the steps of the session get executed
+        self.running = False
+        # "ACTION": the playback is a single undo step, "MACRO": an undo step is pushed after every operator macro
+        self.undo_mode = 'ACTION'
+        # the playing operator waits for the session and pushes the undo step of the action
+        self.undo_owned = False
+        # the session isn't started by an operator with its own undo step, e.g. by a trigger
+        self.undo_push = False
+        # the session was continued outside of the playing operator, e.g. after a Timer event
+        self.resumed = False
+        # timings of the macros, None if the playback isn't profiled
+        self.profile: Optional[PlaybackProfile] = None
+        # context assignments which would set the value that is already set aren't executed
+        self.skip_unchanged = False
+        # number of context assignments which weren't executed because the value was already set
+        self.skipped_writes = 0
+        # resolved overrides (=value) accessed by the ui_type (=key), value format: (window, screen, area, region)
+        self.window_cache = {}
+        # "WINDOW" region (=value) accessed by the area (=key), key format: (area pointer, ui_type)
+        self.region_cache = {}
+        # screen layout the caches were filled with, checked once per slice, see update_layout
+        self.layout_signature = None
+        # objects the plan is executed on one after another (execution mode "OBJECT"),
+        # the selection is restored at the end of the session
+        self.targets = []
+        self.target_index = 0
+        self.view_layer = None
+        self.old_active_object = None
+        self.selection_restored = False
+        # ids of the failed macro and the macros after it, empty if the session didn't fail
+        self.failed_macros = []
+        # objects of a view layer accessed by their name (=value) accessed by the view layer pointer (=key),
+        # value format: (index, generation of the last rebuild)
+        self.object_index = {}
+        # increased on every "Select Object" event, an index is rebuilt at most once per generation
+        self.object_index_generation = 0
+        # notifications which are collected during a slice and flushed at the end of it
+        self.pending_alerts = []
+        # areas (=value) accessed by the area pointer (=key)
+        self.redraw_areas = {}
+        # area which ui_type is swapped for the current commands and its original ui_type
+        self.swapped_area = None
+        self.swapped_area_type = None
+
+    @property
+    def progress(self) -> float:
+        """
+        executed part of the plan
+
+        Returns:
+            float: progress between 0 and 1
+        """
+        if not len(self.plan):
+            return 1.0
+        return min(self.cursor / len(self.plan), 1.0)
+
+    def get_action(self, context: Context) -> Optional[AR_action]:
+        """
+        get the action of this session
+
+        Args:
+            context (Context): active blender context
+
+        Returns:
+            Optional[AR_action]: played action, None if the action no longer exists
+        """
+        ActRec_pref = get_preferences(context)
+        return getattr(ActRec_pref, self.action_type).get(self.action_id)
+
+    def set_alert(self, action: AR_action, step: PlanStep) -> None:
+        """
+        mark the action and the macro of the given step as failed,
+        the alerts are shown with the next flush of the notifications
+
+        Args:
+            action (AR_action): action of the step
+            step (PlanStep): failed step
+        """
+        self.pending_alerts.append(action)
+        macro = action.macros.get(step.macro_id)
+        if macro is not None:
+            self.pending_alerts.append(macro)
+
+    def request_redraw(self, area: Optional[bpy.types.Area]) -> None:
+        """
+        collect the area to redraw it with the next flush of the notifications
+
+        Args:
+            area (Optional[bpy.types.Area]): area to redraw
+        """
+        if area:
+            self.redraw_areas[area.as_pointer()] = area
+
+    def flush_notifications(self) -> None:
+        """
+        apply the collected alerts and redraw the collected areas once
+        """
+        for item in self.pending_alerts:
+            with suppress(ReferenceError):
+                item.alert = True
+        self.pending_alerts.clear()
+        for area in self.redraw_areas.values():
+            with suppress(ReferenceError):
+                area.tag_redraw()
+        self.redraw_areas.clear()
+
+    def fail(self, action: AR_action, step: PlanStep, error: Union[Exception, str]) -> None:
+        """
+        stop the session with the given error
+
+        Args:
+            action (AR_action): action of the session
+            step (PlanStep): failed step
+            error (Union[Exception, str]): error of the step
+        """
+        self.set_alert(action, step)
+        self.error = error
+        # the failed macro and the macros after it, used to find the macro to resume from
+        self.failed_macros = [failed_step.macro_id for failed_step in self.plan.steps[step.index:]]
+        self.finish(action)
+        checkpoints[self.action_key] = self
+
+    def setup_targets(self, context: Context) -> bool:
+        """
+        snapshot the selection and select the first object to execute the plan on
+
+        Args:
+            context (Context): active blender context
+
+        Returns:
+            bool: success, False if no object is selected
+        """
+        self.view_layer = context.view_layer
+        self.targets = context.selected_objects[:]
+        self.old_active_object = self.view_layer.objects.active
+        self.target_index = 0
+        if not self.targets:
+            return False
+        deselect_all(self.view_layer)
+        self.select_target()
+        return True
+
+    def resume_from(self, checkpoint: 'PlaybackSession') -> None:
+        """
+        continue the state of a failed session at its failed macro,
+        the macro is looked up by id because the macros may have changed (e.g. the failed macro is disabled)
+
+        Args:
+            checkpoint (PlaybackSession): failed session
+        """
+        self.start_index = checkpoint.start_index
+        self.cursor = len(self.plan)
+        step_indices = {step.macro_id: step.index for step in self.plan.steps}
+        for macro_id in checkpoint.failed_macros:
+            if macro_id in step_indices:
+                self.cursor = step_indices[macro_id]
+                break
+        self.loop_iterator = checkpoint.loop_iterator
+        self.script_namespaces = checkpoint.script_namespaces
+        if checkpoint.targets:
+            self.view_layer = checkpoint.view_layer
+            self.targets = checkpoint.targets
+            self.target_index = checkpoint.target_index
+            self.old_active_object = checkpoint.old_active_object
+            deselect_all(self.view_layer)
+            with suppress(ReferenceError):
+                self.select_target()
+
+    def select_target(self) -> None:
+        """
+        select and activate the current target object
+        """
+        target = self.targets[self.target_index]
+        target.select_set(True)
+        self.view_layer.objects.active = target
+
+    def next_target(self) -> bool:
+        """
+        continue the plan with the next target object, loops start again for every object
+
+        Returns:
+            bool: success, False if no object is left
+        """
+        if self.target_index + 1 >= len(self.targets):
+            return False
+        with suppress(ReferenceError):
+            self.targets[self.target_index].select_set(False)
+        self.target_index += 1
+        self.cursor = self.start_index
+        self.loop_iterator.clear()
+        self.render_index = None
+        with suppress(ReferenceError):
+            self.select_target()
+        return True
+
+    def restore_selection(self) -> None:
+        """
+        restore the selection of the snapshot taken at the start of the session
+        """
+        if not self.targets or self.selection_restored:
+            return
+        with suppress(ReferenceError):
+            deselect_all(self.view_layer)
+            for object in self.targets:
+                with suppress(ReferenceError):
+                    object.select_set(True)
+            self.view_layer.objects.active = self.old_active_object
+        self.selection_restored = True
+
+    def find_object(self, view_layer: bpy.types.ViewLayer, name: str) -> Optional[bpy.types.Object]:
+        """
+        get an object of the view layer by its name.
+        uses an index of the view layer, which is built once per session
+        and rebuilt on a miss or a stale entry, e.g. objects were renamed, added or removed by a macro.
+        the index is rebuilt at most once per event, further misses of the event are answered by the index
+
+        Args:
+            view_layer (bpy.types.ViewLayer): view layer which contains the object
+            name (str): name of the object
+
+        Returns:
+            Optional[bpy.types.Object]: object, None if the view layer has no object with this name
+        """
+        key = view_layer.as_pointer()
+        index, generation = self.object_index.get(key, (None, -1))
+        if index is not None:
+            object = index.get(name)
+            with suppress(ReferenceError):
+                if object is not None and object.name == name:
+                    return object
+            if generation == self.object_index_generation:
+                # already rebuilt during this event, no macro ran in between
+                return None
+        index = {object.name: object for object in view_layer.objects}
+        self.object_index[key] = (index, self.object_index_generation)
+        return index.get(name)
+
+    def finish(self, action: Optional[AR_action]) -> None:
+        """
+        end the session, cancel all pending timers and remove the session from the active sessions
+
+        Args:
+            action (Optional[AR_action]): action of the session
+        """
+        self.finished = True
+        self.restore_selection()
+        if (self.undo_mode == 'ACTION' and (self.resumed or self.undo_push) and not self.undo_owned
+                and action is not None):
+            # the changes aren't part of the undo step of an operator, e.g. after a resume or a trigger
+            with suppress(RuntimeError):
+                bpy.ops.ed.undo_push(message="ActRec: %s" % action.label)
+        if self.profile is not None:
+            self.profile.finish(self.plan)
+            profiles[self.action_key] = self.profile
+        if self.skip_unchanged:
+            skipped_writes[self.action_key] = self.skipped_writes
+            if self.skipped_writes:
+                logger.info("%s: skipped %i unchanged assignments" % (
+                    action.label if action is not None else self.action_id, self.skipped_writes))
+        for timer in self.timers:
+            if bpy.app.timers.is_registered(timer):
+                bpy.app.timers.unregister(timer)
+        self.timers.clear()
+        sessions.pop(self.id, None)
+        if action is not None:
+            action.is_playing = False
+
+    def cancel(self, context: Context) -> None:
+        """
+        stop the session before all steps are executed
+
+        Args:
+            context (Context): active blender context
+        """
+        self.error = "Playback cancelled"
+        self.finish(self.get_action(context))
+
+    def pause(self, context_copy: Optional[dict], interval: float) -> None:
+        """
+        pause the session and resume it after the given interval
+
+        Args:
+            context_copy (Optional[dict]): copy of the context to resume with (bpy.context.copy())
+            interval (float): time in seconds
+        """
+        timer = functools.partial(run_queued_macros, context_copy, self.id)
+        self.timers.append(timer)
+        bpy.app.timers.register(timer, first_interval=interval)
+
+    def queue_render_complete(self, action: AR_action) -> bool:
+        """
+        queue the session to be resumed after the next "Render Complete" step
+
+        Args:
+            action (AR_action): action of the session
+
+        Returns:
+            bool: success, False if no step follows the "Render Complete" step
+        """
+        render_index = self.plan.next_render_complete(self.cursor)
+        if render_index is None:
+            return True
+        if len(self.plan) <= render_index + 1:
+            self.error = "The 'Render Complete' macro was skipped because no additional macros follow!"
+            self.finish(action)
+            return False
+        self.render_index = render_index
+        shared_data.render_complete_macros.append((self.id, render_index + 1))
+        return True
+
+    def run(self, context: Context) -> Union[Exception, str, None]:
+        """
+        execute the steps from the cursor until the session is paused, finished or failed.
+        with a budget the session pauses after the budget is used and continues in the next slice
+
+        Args:
+            context (Context): active blender context
+
+        Returns:
+            Union[Exception, str, None]: error
+        """
+        action = self.get_action(context)
+        if action is None:
+            self.finish(None)
+            return None
+        action.is_playing = True
+
+        steps = self.plan.steps
+        # paused at the end of the plan, e.g. by a Timer as last macro, continue with the next target object
+        if steps and self.cursor >= len(steps):
+            self.next_target()
+
+        # non-realtime events, execute before macros get executed
+        if self.render_index is None and not self.queue_render_complete(action):
+            return self.error
+
+        profile = self.profile
+        if profile is not None:
+            profile.end_wait()
+        deadline = None if self.budget is None else time.perf_counter() + self.budget
+        self.update_layout(context)
+        self.running = True
+        shared_data.playback_depth += 1
+        try:
+            while self.cursor < len(steps):
+                step = steps[self.cursor]
+                if profile is not None:
+                    start = time.perf_counter()
+                if step.event:
+                    next_index = self.execute_event(context, action, step)
+                else:
+                    next_index = self.execute_command(context, action, step)
+                if profile is not None:
+                    profile.record(step, time.perf_counter() - start, next_index is None and self.error is not None)
+                if next_index is None:  # paused or failed
+                    return self.error
+                self.cursor = next_index
+                if self.cursor >= len(steps) and self.next_target():
+                    if not self.queue_render_complete(action):
+                        return self.error
+                if deadline is not None and self.cursor < len(steps) and time.perf_counter() >= deadline:
+                    # yield to Blender to keep the UI responsive, continue with the next slice
+                    self.pause(context.copy(), 0)
+                    return None
+        finally:
+            self.running = False
+            shared_data.playback_depth -= 1
+            if not shared_data.playback_depth:
+                # the operators of the playback aren't tracked, continue tracking after them
+                get_preferences(context).operators_list_length = len(context.window_manager.operators)
+            self.restore_area()
+            self.flush_notifications()
+        self.finish(action)
+        return None
+
+    def execute_event(self, context: Context, action: AR_action, step: PlanStep) -> Optional[int]:
+        """
+        execute an event step
+
+        Args:
+            context (Context): active blender context
+            action (AR_action): action of the session
+            step (PlanStep): step to execute
+
+        Returns:
+            Optional[int]: index of the next step, None if the session is paused or failed
+        """
+        plan = self.plan
+        data = step.data
+        i = step.index
+        if step.event == 'Render Complete':
+            if self.profile is not None:
+                self.profile.start_wait(step)
+            return None
+        if step.event == 'Timer':
+            if self.profile is not None:
+                self.profile.start_wait(step)
+            self.pause(context.copy(), data['Time'])
+            self.cursor = i + 1
+            return None
+        if step.event == 'Loop':
+            # Skip because it is not a complete loop
+            if i not in plan.loop_end:
+                return i + 1
+
+            loop_iterator = self.loop_iterator
+            if step.macro_id not in loop_iterator:
+                # DEPRECATED count loop start with the Startnumber
+                loop_iterator[step.macro_id] = data.get("Startnumber", 0) if data['StatementType'] == 'count' else 0
+
+            if data['StatementType'] == 'python':
+                if step.error:
+                    logger.error(step.error)
+                    self.fail(action, step, step.error)
+                    return None
+                namespace = self.loop_namespace
+                namespace['context'] = context
+                namespace['loop_counter'] = loop_iterator[step.macro_id]
+                try:
+                    if eval(step.code, namespace):
+                        loop_iterator[step.macro_id] += 1
+                        return i + 1
+                    return plan.loop_end[i] + 1
+                except Exception as err:
+                    err = "Loop condition of macro %s: %s" % (step.macro_id, err)
+                    logger.error(err)
+                    self.fail(action, step, err)
+                    return None
+            elif data['StatementType'] == 'count':
+                # DEPRECATED used to support old count loop macros
+                if loop_iterator[step.macro_id] < data["Endnumber"]:
+                    loop_iterator[step.macro_id] += data["Stepnumber"]
+                    return i + 1
+                return plan.loop_end[i] + 1
+            if loop_iterator[step.macro_id] < data["RepeatCount"]:
+                loop_iterator[step.macro_id] += 1
+                return i + 1
+            return plan.loop_end[i] + 1
+        if step.event == 'EndLoop':
+            # Skip because it is not a complete loop
+            return plan.loop_start.get(i, i + 1)
+        if step.event == 'Select Object':
+            view_layer = context.view_layer
+            self.object_index_generation += 1
+            if not data.get('KeepSelection', False):
+                deselect_all(view_layer)
+
+            for object_name in data.get('Objects', []):
+                if object := self.find_object(view_layer, object_name):
+                    object.select_set(True)
+
+            if data.get('Object', "") == "":
+                return i + 1
+
+            main_object = self.find_object(view_layer, data['Object'])
+            if main_object is None:
+                self.fail(action, step, "%s Object doesn't exist in the active view layer" % data['Object'])
+                return None
+
+            view_layer.objects.active = main_object
+            main_object.select_set(True)
+            return i + 1
+        if step.event == 'Run Script':
+            if step.error:
+                logger.error(step.error)
+                self.fail(action, step, step.error)
+                return None
+            filename = get_script_filename(step)
+            if data.get('KeepNamespace', False):
+                namespace = self.script_namespaces.setdefault(step.macro_id, {})
+            else:
+                namespace = {}
+            namespace.update(__name__=os.path.splitext(filename)[0], __file__=filename)
+            try:
+                exec(step.code, namespace)
+            except Exception as err:
+                # make the source lines of the script available for the traceback
+                script_text = data['ScriptText']
+                linecache.cache[filename] = (len(script_text), None, script_text.splitlines(True), filename)
+                # removes exec(step.code, namespace) of this function
+                error = "".join(traceback.format_exception(type(err), err, err.__traceback__.tb_next))
+                logger.error("%s; command: %s" % (error, data))
+                self.fail(action, step, error)
+                return None
+            return i + 1
+        return i + 1
+
+    def execute_command(self, context: Context, action: AR_action, step: PlanStep) -> Optional[int]:
+        """
+        execute a command step
+
+        Args:
+            context (Context): active blender context
+            action (AR_action): action of the session
+            step (PlanStep): step to execute
+
+        Returns:
+            Optional[int]: index of the next step, None if the session failed
+        """
+        if step.error:
+            logger.error(step.error)
+            self.fail(action, step, step.error)
+            return None
+        if action.execution_mode == "INDIVIDUAL" and step.compiled.assignment is not None:
+            return self.execute_assignments(context, action, step)
+
+        try:
+            if self.swapped_area is not None and self.swapped_area.ui_type != step.ui_type:
+                self.restore_area()
+            temp_window, temp_screen, temp_area, temp_region = self.resolve_override(context, step.ui_type)
+
+            # Note: region need to be set when override area for temp_override
+            # for more detail see https://projects.blender.org/blender/blender/issues/106373
+            with context.temp_override(
+                    window=temp_window,
+                    screen=temp_screen,
+                    area=temp_area,
+                    region=temp_region):
+                if action.execution_mode == "INDIVIDUAL":
+                    execute_individually(context, step.compiled)
+                elif self.skip_unchanged and step.compiled.is_unchanged(context):
+                    self.skipped_writes += 1
+                else:
+                    step.compiled.run(context)
+
+            if self.undo_mode == 'MACRO' and step.command.startswith("bpy.ops."):
+                # operators called from python don't push undo steps on their own
+                macro = action.macros.get(step.macro_id)
+                with suppress(RuntimeError):
+                    bpy.ops.ed.undo_push(message="ActRec: %s" % (macro.label if macro else step.command))
+            if bpy.context:
+                self.request_redraw(bpy.context.area)
+            return step.index + 1
+
+        except Exception as err:
+            logger.error("%s; command: %s" % (err, step.command))
+            self.restore_area()
+            self.fail(action, step, err)
+            return None
+
+    def execute_assignments(self, context: Context, action: AR_action, step: PlanStep) -> Optional[int]:
+        """
+        apply the given and all directly following assignments to the active object
+        on every selected object in one pass, without changing the selection
+
+        Args:
+            context (Context): active blender context
+            action (AR_action): action of the session
+            step (PlanStep): first assignment step
+
+        Returns:
+            Optional[int]: index of the next step, None if the session failed
+        """
+        assignment_steps = [step]
+        for next_step in self.plan.steps[step.index + 1:]:
+            if next_step.event or next_step.error or next_step.compiled.assignment is None:
+                break
+            assignment_steps.append(next_step)
+        for object in context.selected_objects:
+            for assignment_step in assignment_steps:
+                if self.skip_unchanged and assignment_step.compiled.is_unchanged(object, skip=1):
+                    self.skipped_writes += 1
+                    continue
+                try:
+                    assignment_step.compiled.assign(object)
+                except Exception as err:
+                    logger.error("%s; command: %s" % (err, assignment_step.command))
+                    self.fail(action, assignment_step, err)
+                    return None
+        return assignment_steps[-1].index + 1
+
+    def get_layout_signature(self, context: Context) -> tuple:
+        """
+        identifies the screen layout of all windows, changes if a window or screen is added, removed or switched
+
+        Args:
+            context (Context): active blender context
+
+        Returns:
+            tuple: signature of the layout
+        """
+        return tuple(
+            (window.as_pointer(), window.screen.as_pointer(), len(window.screen.areas))
+            for window in context.window_manager.windows
+        )
+
+    def update_layout(self, context: Context) -> None:
+        """
+        clear the cached windows and regions if the screen layout changed since the last slice
+
+        Args:
+            context (Context): active blender context
+        """
+        layout_signature = self.get_layout_signature(context)
+        if layout_signature != self.layout_signature:
+            self.layout_signature = layout_signature
+            self.window_cache.clear()
+            self.region_cache.clear()
+
+    def resolve_override(self, context: Context, ui_type: str) -> tuple:
+        """
+        get the window, screen, area and region to execute a command with the given ui_type in.
+        uses a window which shows the ui_type or swaps the ui_type of the active area,
+        the swapped area is kept for the following commands with the same ui_type.
+        the resolved windows and regions are cached until the screen layout changes, see update_layout
+
+        Args:
+            context (Context): active blender context
+            ui_type (str): ui_type of the command
+
+        Returns:
+            tuple: format (window, screen, area, region)
+        """
+        temp_area = context.area
+        if not temp_area:
+            return context.window, context.screen, temp_area, context.region
+        if ui_type and temp_area.ui_type != ui_type:
+            override = self.window_cache.get(ui_type)
+            if override is None or override[2].ui_type != ui_type:
+                override = None
+                for window in reversed(context.window_manager.windows):
+                    if window.screen.areas[0].ui_type == ui_type:
+                        area = window.screen.areas[0]
+                        override = (window, window.screen, area, self.get_window_region(area))
+                        break
+                self.window_cache[ui_type] = override
+            if override is not None:
+                window, screen, area, region = override
+                return window, screen, area, region or context.region
+            self.swapped_area = temp_area
+            self.swapped_area_type = temp_area.ui_type
+            temp_area.ui_type = ui_type
+        return context.window, context.screen, temp_area, self.get_window_region(temp_area) or context.region
+
+    def get_window_region(self, area: bpy.types.Area) -> Optional[bpy.types.Region]:
+        """
+        get the "WINDOW" region of the given area, the result is cached until the screen layout changes
+
+        Args:
+            area (bpy.types.Area): area to get the region from
+
+        Returns:
+            Optional[bpy.types.Region]: "WINDOW" region, None if the area has none
+        """
+        key = (area.as_pointer(), area.ui_type)
+        if key in self.region_cache:
+            return self.region_cache[key]
+        window_region = None
+        # mostly "WINDOW" is at the end of the list
+        for region in reversed(area.regions):
+            if region.type == "WINDOW":
+                window_region = region
+                break
+        self.region_cache[key] = window_region
+        return window_region
+
+    def restore_area(self) -> None:
+        """
+        swap the ui_type of the area back, which was changed to execute commands with another ui_type
+        """
+        if self.swapped_area is None:
+            return
+        with suppress(ReferenceError):
+            self.swapped_area.ui_type = self.swapped_area_type
+        self.swapped_area = None
+        self.swapped_area_type = None
+
+
+# running and paused sessions (=value) accessed by the session id (=key),
+# finished sessions are removed to release their state
+sessions: dict[str, PlaybackSession] = {}
+# last failed session (=value) of an action accessed by the action type and id (=key), used to resume the playback
+checkpoints: dict[tuple[str, str], PlaybackSession] = {}
+# number of skipped unchanged assignments (=value) of the last playback
+# accessed by the action type and id (=key), only set if the session skipped unchanged assignments
+skipped_writes: dict[tuple[str, str], int] = {}
+
+
+def get_session(action_type: str, action_id: str) -> Optional[PlaybackSession]:
+    """
+    get the running or paused session of the given action
+
+    Args:
+        action_type (str): action type of the played action
+        action_id (str): id of the played action
+
+    Returns:
+        Optional[PlaybackSession]: session of the action, None if the action isn't playing
+    """
+    for session in sessions.values():
+        if session.action_key == (action_type, action_id):
+            return session
+    return None
+
+
+def is_playback_running() -> bool:
+    """
+    check if the steps of any session are executed at the moment, e.g. the caller is a macro
+
+    Returns:
+        bool: state
+    """
+    return any(session.running for session in sessions.values())
+
+
+def cancel_all_sessions() -> None:
+    """
+    stop all running and paused sessions, e.g. when a new file is loaded
+    """
+    for session in list(sessions.values()):
+        session.finish(None)
+    shared_data.render_complete_macros.clear()
+    checkpoints.clear()
+    skipped_writes.clear()
+
+# endregion
+
+# region functions
+
+
+def run_queued_macros(context_copy: Optional[dict], session_id: str) -> None:
+    """
+    resume a paused playback session
+
+    Args:
+        context_copy (Optional[dict]): copy of the active context (bpy.context.copy())
+        session_id (str): id of the session to resume
+    """
+    session = sessions.get(session_id)
+    if session is None:
+        return
+    session.timers = [timer for timer in session.timers if bpy.app.timers.is_registered(timer)]
+    session.resumed = True
+    context = bpy.context
+    if context_copy is None:
+        temp_override = context.temp_override()
+    else:
+        temp_override = context.temp_override(**context_copy)
+    with temp_override:
+        session.run(context)
+
+
+def deselect_all(view_layer: bpy.types.ViewLayer) -> None:
+    """
+    deselect all objects of the view layer, uses a single operator call if it's available in the current context
+
+    Args:
+        view_layer (bpy.types.ViewLayer): view layer to deselect the objects in
+    """
+    if bpy.ops.object.select_all.poll():
+        bpy.ops.object.select_all(action='DESELECT')
+        return
+    for object in view_layer.objects.selected:
+        with suppress(ReferenceError):
+            object.select_set(False)
+
+
+def execute_individually(context: Context, command: CompiledCommand) -> None:
+    """
+    execute the given command on each selected object individually
+
+    Args:
+        context (Context): active blender context
+        command (CompiledCommand): command to execute
+    """
+    old_selected_objects = context.selected_objects[:]
+    for object in old_selected_objects:
+        object.select_set(False)
+
+    for object in old_selected_objects:
+        object.select_set(True)
+        context.view_layer.objects.active = object
+        command.run(context)
+        with suppress(ReferenceError):
+            object.select_set(False)
+
+    for object in old_selected_objects:
+        with suppress(ReferenceError):
+            object.select_set(True)
+
+
+def get_undo_mode(context: Context, action: AR_action) -> str:
+    """
+    get the undo mode of the action, resolves the default to the undo mode of the preferences
+
+    Args:
+        context (Context): active blender context
+        action (AR_action): action to get the undo mode from
+
+    Returns:
+        str: "ACTION" or "MACRO"
+    """
+    if action.undo_mode == 'DEFAULT':
+        return get_preferences(context).undo_mode
+    return action.undo_mode
+
+
+def play(
+        context: Context,
+        macros: CollectionProperty,
+        action: AR_action,
+        action_type: str,
+        start_index: int = 0,
+        budget: Optional[float] = None,
+        profile: bool = False,
+        undo_push: bool = False) -> Union[Exception, str, None]:
+    """
+    execute all given macros in the given context inside a new playback session.
+    action, action_type are used to run the macros of the given action with delay to the execution.
+    with a budget the macros are executed in time slices through bpy.app.timers,
+    nested playbacks (played by a macro) always run blocking
+
+    Args:
+        context (Context): active blender context
+        macros (CollectionProperty): macros to execute
+        action (AR_action): action to track
+        action_type (str): action type of the given action
+        start_index (int): the index of the macro where to start
+        budget (Optional[float]): time in seconds of a slice, None executes all macros at once
+        profile (bool): record the timings of the macros, see profiler.profiles
+        undo_push (bool): push the undo step of the action at the end of the session,
+            for callers which aren't operators with their own undo step
+
+    Returns:
+        Exception, str: error
+    """
+    checkpoints.pop((action_type, action.id), None)
+    session = create_session(context, macros, action, action_type, start_index, budget, profile)
+    session.undo_push = undo_push
+    if action.execution_mode == "OBJECT" and not session.setup_targets(context):
+        return None
+    sessions[session.id] = session
+    return session.run(context)
+
+
+def resume(
+        context: Context,
+        action: AR_action,
+        action_type: str,
+        budget: Optional[float] = None,
+        profile: bool = False) -> Union[Exception, str, None]:
+    """
+    continue the last failed playback of the given action from the failed macro
+
+    Args:
+        context (Context): active blender context
+        action (AR_action): action to resume
+        action_type (str): action type of the given action
+        budget (Optional[float]): time in seconds of a slice, None executes all macros at once
+        profile (bool): record the timings of the macros, see profiler.profiles
+
+    Returns:
+        Exception, str: error
+    """
+    checkpoint = checkpoints.pop((action_type, action.id), None)
+    # the local and global copy of an action have the same id, only the checkpoint of this collection is resumed
+    if checkpoint is None or checkpoint.action_key != (action_type, action.id):
+        return "The action has no failed playback to resume"
+    session = create_session(context, action.macros, action, action_type, checkpoint.start_index, budget, profile)
+    session.resume_from(checkpoint)
+    sessions[session.id] = session
+    return session.run(context)
+
+
+def create_session(
+        context: Context,
+        macros: CollectionProperty,
+        action: AR_action,
+        action_type: str,
+        start_index: int,
+        budget: Optional[float],
+        profile: bool) -> PlaybackSession:
+    """
+    create a new playback session of the given macros, see play for the arguments
+
+    Returns:
+        PlaybackSession: created session
+    """
+    undo_mode = get_undo_mode(context, action)
+    plan = get_plan(action_type, action.id, macros)
+    session = PlaybackSession(action, action_type, plan, start_index)
+    session.undo_mode = undo_mode
+    # unbalanced loops are skipped, mark them to show the problem to the user
+    for diagnostic in plan.diagnostics:
+        if macro := action.macros.get(diagnostic.macro_id):
+            session.pending_alerts.append(macro)
+    session.skip_unchanged = get_preferences(context).playback_skip_unchanged
+    if not is_playback_running():
+        session.budget = budget
+    if profile:
+        session.profile = PlaybackProfile(
+            action_type, action.id, action.label, {macro.id: macro.label for macro in macros})
+    return session
+
+
+@ persistent
+def execute_render_complete(dummy=None) -> None:
+    # https://docs.blender.org/api/current/bpy.app.handlers.html
+    """
+    execute macros, which are called after the event macro "Render Complete"
+    use bpy.app.handlers and therefore uses a dummy variable for the scene object
+
+    Args:
+        dummy (bpy.types.Scene, optional): unused. Defaults to None.
+    """
+    while shared_data.render_complete_macros:
+        session_id, start_index = shared_data.render_complete_macros.popleft()
+        session = sessions.get(session_id)
+        if session is None:
+            continue
+        session.cursor = start_index
+        session.render_index = None
+        session.pause(None, 0.1)
+
+# endregion
@@ -0,0 +1,224 @@
+# region Imports
+# external modules
+from typing import Optional
+import os
+import csv
+import json
+import time
+from datetime import datetime
+
+# relative imports
+from .plan import ExecutionPlan, PlanStep
+# endregion
+
+# region Profiler
+
+
+class MacroProfile:
+    """timings of a single macro during a profiled playback"""
+    __slots__ = ("macro_id", "index", "label", "time", "wait_time", "loop_time", "calls", "errors")
+
+    def __init__(self, macro_id: str, index: int, label: str) -> None:
+        self.macro_id = macro_id
+        self.index = index
+        self.label = label
+        # time in seconds spent to execute the macro itself
+        self.time = 0.0
+        # time in seconds the playback waited after the macro (Timer, Render Complete)
+        self.wait_time = 0.0
+        # time in seconds spent inside the loop, only used by Loop macros
+        self.loop_time = 0.0
+        self.calls = 0
+        self.errors = 0
+
+    @property
+    def total_time(self) -> float:
+        """
+        time used by the macro, including the waits and the time inside the loop
+
+        Returns:
+            float: time in seconds
+        """
+        return self.time + self.wait_time + self.loop_time
+
+    def to_dict(self) -> dict:
+        """
+        convert the profile to a python dict
+
+        Returns:
+            dict: profile
+        """
+        return {
+            'macro_id': self.macro_id,
+            'index': self.index,
+            'label': self.label,
+            'time': self.time,
+            'wait_time': self.wait_time,
+            'loop_time': self.loop_time,
+            'total_time': self.total_time,
+            'calls': self.calls,
+            'errors': self.errors
+        }
+
+
+class PlaybackProfile:
+    """timings of all macros of a profiled playback"""
+
+    def __init__(self, action_type: str, action_id: str, action_label: str, labels: dict) -> None:
+        """
+        Args:
+            action_type (str): action type of the played action
+            action_id (str): id of the played action
+            action_label (str): label of the played action
+            labels (dict): labels of the macros (=value) accessed by the macro id (=key)
+        """
+        self.action_type = action_type
+        self.action_id = action_id
+        self.action_label = action_label
+        self.labels = labels
+        self.created = datetime.now()
+        self.start_time = time.perf_counter()
+        self.end_time = None
+        # profiles (=value) accessed by the macro id (=key)
+        self.macros: dict[str, MacroProfile] = {}
+        # step and start time of the wait, which is recorded when the playback resumes
+        self.wait: Optional[tuple] = None
+
+    def get_macro(self, step: PlanStep) -> MacroProfile:
+        """
+        get the profile of the macro of the given step
+
+        Args:
+            step (PlanStep): executed step
+
+        Returns:
+            MacroProfile: profile of the macro
+        """
+        macro = self.macros.get(step.macro_id)
+        if macro is None:
+            macro = self.macros[step.macro_id] = MacroProfile(
+                step.macro_id, step.index, self.labels.get(step.macro_id, step.macro_id)
+            )
+        return macro
+
+    def record(self, step: PlanStep, duration: float, failed: bool) -> None:
+        """
+        record an execution of the given step
+
+        Args:
+            step (PlanStep): executed step
+            duration (float): time in seconds of the execution
+            failed (bool): the execution raised an error
+        """
+        macro = self.get_macro(step)
+        macro.time += duration
+        macro.calls += 1
+        macro.errors += failed
+
+    def start_wait(self, step: PlanStep) -> None:
+        """
+        start to measure a wait of the playback after the given step
+
+        Args:
+            step (PlanStep): step which pauses the playback
+        """
+        self.wait = (step, time.perf_counter())
+
+    def end_wait(self) -> None:
+        """
+        record the running wait, called when the playback resumes
+        """
+        if self.wait is None:
+            return
+        step, start = self.wait
+        self.get_macro(step).wait_time += time.perf_counter() - start
+        self.wait = None
+
+    def finish(self, plan: ExecutionPlan) -> None:
+        """
+        end the profile and sum up the time spent inside the loops
+
+        Args:
+            plan (ExecutionPlan): executed plan
+        """
+        self.end_wait()
+        self.end_time = time.perf_counter()
+        for start, end in plan.loop_end.items():
+            loop = self.macros.get(plan.steps[start].macro_id)
+            if loop is None:
+                continue
+            loop.loop_time = sum(
+                macro.time + macro.wait_time
+                for step in plan.steps[start + 1: end + 1]
+                if (macro := self.macros.get(step.macro_id))
+            )
+
+    @property
+    def total_time(self) -> float:
+        """
+        time of the whole playback
+
+        Returns:
+            float: time in seconds
+        """
+        return (self.end_time or time.perf_counter()) - self.start_time
+
+    def ranked(self) -> list[MacroProfile]:
+        """
+        get the macros ranked by the time they used (without the time inside the loop)
+
+        Returns:
+            list[MacroProfile]: profiles, the slowest first
+        """
+        return sorted(self.macros.values(), key=lambda macro: macro.time + macro.wait_time, reverse=True)
+
+    def to_dict(self) -> dict:
+        """
+        convert the profile to a python dict
+
+        Returns:
+            dict: profile
+        """
+        return {
+            'action_type': self.action_type,
+            'action_id': self.action_id,
+            'action_label': self.action_label,
+            'created': self.created.isoformat(),
+            'total_time': self.total_time,
+            'macros': [macro.to_dict() for macro in self.ranked()]
+        }
+
+    def export(self, directory: str, file_format: str) -> str:
+        """
+        write the profile to a new file in the given directory
+
+        Args:
+            directory (str): directory to write the file to
+            file_format (str): "JSON" or "CSV"
+
+        Returns:
+            str: path of the written file
+        """
+        path = os.path.join(
+            directory,
+            "ActRec_Profile_%s_%s.%s" % (
+                "".join(x if x.isalnum() else "_" for x in self.action_label),
+                self.created.strftime('%d-%m-%Y_%H-%M-%S'),
+                file_format.lower()
+            )
+        )
+        data = self.to_dict()
+        with open(path, 'w', encoding='utf-8', newline='') as profile_file:
+            if file_format == 'JSON':
+                json.dump(data, profile_file, ensure_ascii=False, indent=2)
+            else:
+                writer = csv.DictWriter(profile_file, fieldnames=list(MacroProfile.__slots__) + ['total_time'])
+                writer.writeheader()
+                writer.writerows(data['macros'])
+        return path
+
+
+# last profile (=value) of an action accessed by the action type and id (=key)
+profiles: dict[tuple[str, str], PlaybackProfile] = {}
+
+# endregion
@@ -3,25 +3,19 @@
 from typing import Optional, Union
 from contextlib import suppress
 from collections import defaultdict
-import json
 import os
 import sys
 import numpy
-import functools
 import subprocess
-import traceback
 from typing import TYPE_CHECKING
-from mathutils import Vector, Matrix, Color, Euler, Quaternion
 
 # blender modules
 import bpy
 import bl_math
-from bpy.app.handlers import persistent
 from bpy.types import PointerProperty, Property, CollectionProperty, Context, AddonPreferences, PropertyGroup
 
 # relative imports
 from ..log import logger
-from .. import shared_data
 if TYPE_CHECKING:
     from ..preferences import AR_preferences
     from ..properties.shared import AR_action
@@ -292,6 +286,25 @@ def get_categorized_view_3d_modes(items: CollectionProperty, value_offset: int =
     return general + grease_pencil + curves
 
 
+def split_context_assignment(command: str) -> Optional[tuple]:
+    """
+    split a context command in the format bpy.context.<path>.<prop> = <value>
+
+    Args:
+        command (str): Blender command to split
+
+    Returns:
+        Optional[tuple]: format (path, prop, value), None if the command isn't a context assignment
+    """
+    if not command.startswith("bpy.context."):
+        return None
+    split = command.split(' = ')
+    if len(split) <= 1:
+        return None
+    *path, prop = split[0].replace("bpy.context.", "").split(".")
+    return path, prop, split[1]
+
+
 def get_name_of_command(context: Context, command: str) -> Optional[str]:
     """
     get the name of a given command
@@ -312,11 +325,11 @@ def get_name_of_command(context: Context, command: str) -> Optional[str]:
     if not command.startswith("bpy.context."):
         return None
 
-    split = command.split(' = ')
-    if len(split) <= 1:
-        return ".".join(split[0].split('.')[-2:])
+    assignment = split_context_assignment(command)
+    if assignment is None:
+        return ".".join(command.split('.')[-2:])
 
-    *path, prop = split[0].replace("bpy.context.", "").split(".")
+    path, prop, value = assignment
     obj = context
     if obj:
         for x in path:
@@ -329,7 +342,6 @@ def get_name_of_command(context: Context, command: str) -> Optional[str]:
                 if prop in props:
                     prop = props[prop].name
 
-    value = split[1]
     if value.startswith("bpy.data."):
         value = value.split("[")[-1].replace("]", "")[1:-1]
 
@@ -395,332 +407,6 @@ def update_command(command: str) -> Union[str, bool]:
     return "%s(%s)" % (command, ", ".join(inputs))
 
 
-def run_queued_macros(context_copy: dict, action_type: str, action_id: str, start: int) -> None:
-    """
-    runs macros from a given index of a specific action
-
-    Args:
-        context_copy (dict): copy of the active context (bpy.context.copy())
-        action_type (str): "global_actions" or "local_actions"
-        action_id (str): id of the action with the macros to execute
-        start (int): macro to start with in the macro collection
-    """
-    context = bpy.context
-    if context_copy is None:
-        temp_override = context.temp_override()
-    else:
-        temp_override = context.temp_override(**context_copy)
-    with temp_override:
-        ActRec_pref = context.preferences.addons[__module__].preferences
-        action = getattr(ActRec_pref, action_type)[action_id]
-        play(context, action.macros, action, action_type, start)
-
-
-def execute_individually(context: Context, command: str) -> None:
-    """
-    execute the given command on each selected object individually
-
-    Args:
-        context (Context): active blender context
-        command (str): command to execute
-    """
-    old_selected_objects = context.selected_objects[:]
-    for object in old_selected_objects:
-        object.select_set(False)
-
-    for object in old_selected_objects:
-        object.select_set(True)
-        context.view_layer.objects.active = object
-        exec(command)
-        with suppress(ReferenceError):
-            object.select_set(False)
-
-    for object in old_selected_objects:
-        with suppress(ReferenceError):
-            object.select_set(True)
-
-
-# table to point from the end-loop macro (=key) to the start-loop macro (=value)
-loop_table = {}
-
-# table the holds the iterator (=value) of a loop accessed by the start-loop macro (=key)
-loop_iterator = {}
-
-# table the holds the loop size excluding start-loop macro but including end-loop macro (=value)
-# accessed by the start-loop macro (=key)
-loop_size = {}
-
-
-def play(
-        context: Context,
-        macros: CollectionProperty,
-        action: AR_action,
-        action_type: str,
-        start_index: int = 0) -> Union[Exception, str, None]:
-    """
-    execute all given macros in the given context.
-    action, action_type are used to run the macros of the given action with delay to the execution
-
-    Args:
-        context (Context): active blender context
-        macros (CollectionProperty): macros to execute
-        action (AR_action): action to track
-        action_type (str): action type of the given action
-        start_index (int): the index of the macro where to start
-
-    Returns:
-        Exception, str: error
-    """
-    action.is_playing = True
-    macros = [macro for macro in macros if macro.active]
-
-    # non-realtime events, execute before macros get executed
-    for i, macro in enumerate(macros[start_index:]):
-        split = macro.command.split(":")
-        if split[0] != 'ar.event':
-            continue
-        data = json.loads(":".join(split[1:]))
-        if data['Type'] == 'Render Complete':
-            # SKip only render complete macro
-            if len(macros) <= i + 1:
-                action.is_playing = False
-                return "The 'Render Complete' macro was skipped because no additional macros follow!"
-            shared_data.render_complete_macros.append(
-                (action_type, action.id, macros[i + 1].id))
-            break
-        elif data['Type'] == 'Loop':
-            loop_count = 1
-            for j, process_macro in enumerate(macros[i + 1:], 1):
-                if not process_macro.active:
-                    continue
-                split = process_macro.command.split(":")
-                if split[0] != 'ar.event':
-                    continue
-                process_data = json.loads(":".join(split[1:]))
-                loop_count += 2 * \
-                    (process_data['Type'] == 'Loop') - \
-                    (process_data['Type'] == 'EndLoop')  # 1 or -1
-                if loop_count == 0:
-                    loop_table[process_macro.id] = macro.id
-                    loop_size[macro.id] = j
-                    loop_iterator[macro.id] = 0
-                    if data['StatementType'] == 'count':
-                        # DEPRECATED used to support old count loop macros
-                        loop_iterator[macro.id] = data["Startnumber"]
-                    break
-
-    base_area = context.area
-
-    i = start_index
-    while i < len(macros):
-        macro = macros[i]
-        split = macro.command.split(":")
-        if split[0] == 'ar.event':  # Handle Ar Events
-            data: dict = json.loads(":".join(split[1:]))
-            if data['Type'] in {'Render Complete'}:
-                return
-            if data['Type'] == 'Timer':
-                bpy.app.timers.register(
-                    functools.partial(
-                        run_queued_macros,
-                        context.copy(),
-                        action_type,
-                        action.id,
-                        i + 1
-                    ),
-                    first_interval=data['Time']
-                )
-                return
-            if data['Type'] == 'Loop':
-                # Skip because it is not a complete loop
-                if macro.id not in loop_iterator:
-                    i += 1
-                    continue
-
-                if data['StatementType'] == 'python':
-                    try:
-                        if eval(data["PyStatement"]):
-                            i += 1
-                        else:
-                            i += loop_size[macro.id] + 1
-                    except Exception as err:
-                        logger.error(err)
-                        action.alert = macro.alert = True
-                        action.is_playing = False
-                        return err
-                elif data['StatementType'] == 'count':
-                    # DEPRECATED used to support old count loop macros
-                    if loop_iterator[macro.id] < data["Endnumber"]:
-                        loop_iterator[macro.id] += data["Stepnumber"]
-                        i += 1
-                    else:
-                        i += loop_size[macro.id] + 1
-                else:
-                    if loop_iterator[macro.id] < data["RepeatCount"]:
-                        loop_iterator[macro.id] += 1
-                        i += 1
-                    else:
-                        i += loop_size[macro.id] + 1
-                continue
-            elif data['Type'] == 'Select Object':
-                selected_objects = context.selected_objects
-
-                if not data.get('KeepSelection', False):
-                    for object in selected_objects:
-                        object.select_set(False)
-                    selected_objects.clear()
-
-                for object_name in data.get('Objects', []):
-                    if object := bpy.data.objects.get(object_name):
-                        object.select_set(True)
-                        selected_objects.append(object)
-
-                if data.get('Object', "") == "":
-                    i += 1
-                    continue
-
-                objects = context.view_layer.objects
-                main_object = bpy.data.objects.get(data['Object'])
-                if main_object is None or main_object not in objects.values():
-                    action.alert = macro.alert = True
-                    action.is_playing = False
-                    return "%s Object doesn't exist in the active view layer" % data['Object']
-
-                objects.active = main_object
-                main_object.select_set(True)
-                selected_objects.append(main_object)
-                i += 1
-                continue
-            elif data['Type'] == 'Run Script':
-                text = bpy.data.texts.new(macro.id)
-                text.clear()
-                text.write(data['ScriptText'])
-                try:
-                    text.as_module()
-                except Exception:
-                    error = traceback.format_exception(*sys.exc_info())
-                    # corrects the filename of the exception to the text name, otherwise "<string>"
-                    error_split = error[3].replace('"<string>"', '').split(',')
-                    error[3] = '%s "%s",%s' % (
-                        error_split[0], text.name, error_split[1])
-                    # removes exec(self.as_string(), mod.__dict__) in bpy_types.py
-                    error.pop(2)
-                    error.pop(1)  # removes text.as_module()
-                    error = "".join(error)
-                    logger.error("%s; command: %s" % (error, data))
-                    action.alert = macro.alert = True
-                    return error
-                bpy.data.texts.remove(text)
-                i += 1
-                continue
-            elif data['Type'] == 'EndLoop':
-                start_id = loop_table[macro.id]
-                i -= loop_size[start_id]
-                continue
-
-        try:
-            command = macro.command
-            if (command.startswith("bpy.ops.ar.local_play")
-                    and set(extract_properties(command.split("(")[1][: -1])) == {"id=\"\"", "index=-1"}):
-                err = "Don't run Local Play with default properties, this may cause recursion"
-                logger.error(err)
-                action.alert = macro.alert = True
-                action.is_playing = False
-                return err
-
-            if command.startswith("bpy.ops."):
-                split = command.split("(")
-                command = "%s(\"%s\", %s" % (
-                    split[0],
-                    macro.operator_execution_context,
-                    "(".join(split[1:]))
-            elif command.startswith("bpy.context."):
-                command = command.replace("bpy.context.", "context.")
-
-            temp_window = context.window
-            temp_screen = context.screen
-            temp_area = context.area
-            temp_region = context.region
-            area_type = None
-            if temp_area and macro.ui_type and temp_area.ui_type != macro.ui_type:
-                windows = list(context.window_manager.windows)
-                windows.reverse()
-                for window in windows:
-                    if window.screen.areas[0].ui_type == macro.ui_type:
-                        temp_window = window
-                        temp_screen = temp_window.screen
-                        temp_area = temp_screen.areas[0]
-                        break
-                else:
-                    area_type = temp_area.ui_type
-                    temp_area.ui_type = macro.ui_type
-            if temp_area:
-                # mostly "WINDOW" is at the end of the list
-                for region in reversed(temp_area.regions):
-                    if region.type != "WINDOW":
-                        continue
-                    temp_region = region
-
-            # Note: region need to be set when override area for temp_override
-            # for more detail see https://projects.blender.org/blender/blender/issues/106373
-            with context.temp_override(
-                    window=temp_window,
-                    screen=temp_screen,
-                    area=temp_area,
-                    region=temp_region):
-                if action.execution_mode == "GROUP":
-                    exec(command)
-                else:
-                    execute_individually(context, command)
-
-            if temp_area and area_type:
-                temp_area.ui_type = area_type
-
-            if bpy.context and bpy.context.area:
-                bpy.context.area.tag_redraw()
-            i += 1
-
-        except Exception as err:
-            logger.error("%s; command: %s" % (err, command))
-            action.alert = macro.alert = True
-            if base_area and area_type:
-                base_area.ui_type = area_type
-            action.is_playing = False
-            return err
-    else:
-        action.is_playing = False
-
-
-@ persistent
-def execute_render_complete(dummy=None) -> None:
-    # https://docs.blender.org/api/current/bpy.app.handlers.html
-    """
-    execute macros, which are called after the event macro "Render Complete"
-    use bpy.app.handlers and therefore uses a dummy variable for the scene object
-
-    Args:
-        dummy (bpy.types.Scene, optional): unused. Defaults to None.
-    """
-    context = bpy.context
-    ActRec_pref = get_preferences(context)
-    while len(shared_data.render_complete_macros):
-        action_type, action_id, start_id = shared_data.render_complete_macros.pop(0)
-        action = getattr(ActRec_pref, action_type)[action_id]
-        if (start_index := action.macros.find(start_id)) < 0:
-            continue
-
-        bpy.app.timers.register(
-            functools.partial(
-                run_queued_macros,
-                None,
-                action_type,
-                action_id,
-                start_index
-            ),
-            first_interval=0.1
-        )
-
-
 def get_font_path() -> str:
     """
     get the font path of the active font in Blender
@@ -0,0 +1,216 @@
+# region Imports
+# external modules
+from typing import Optional
+from collections import deque
+import time
+import functools
+
+# blender modules
+import bpy
+from bpy.app.handlers import persistent
+
+# relative imports
+from ..log import logger
+from .playback import play, is_playback_running, get_session
+from .shared import get_preferences
+# endregion
+
+__module__ = __package__.split(".")[0]
+
+# region Triggers
+
+# Blender handler (=value) of a trigger accessed by the trigger type (=key)
+TRIGGERS = {
+    'SAVE_POST': 'save_post',
+    'FRAME_CHANGE_POST': 'frame_change_post',
+    'LOAD_POST': 'load_post',
+    'DEPSGRAPH_UPDATE_POST': 'depsgraph_update_post',
+    'RENDER_COMPLETE': 'render_complete'
+}
+
+# ids of the global actions (=value) accessed by the trigger type (=key),
+# None if the index needs to be rebuilt
+trigger_index: Optional[dict[str, list[str]]] = None
+# number of global actions the index was built for
+trigger_index_length = -1
+# time the action was dispatched last (=value) accessed by the action id (=key)
+last_dispatch = {}
+# ids of the actions which are queued or wait for their interval, further triggers are coalesced
+pending = set()
+# ids of the actions to play, consumed by dispatch
+dispatch_queue = deque()
+# timers which queue an action at the end of its interval
+delayed = []
+# ids of the dispatched actions, depsgraph updates are caused by their playback and don't trigger actions
+dispatched = set()
+# the dispatched playbacks are finished, the suppression ends after their last depsgraph update is handled
+release_next = False
+
+
+def invalidate_trigger_index() -> None:
+    """
+    rebuild the trigger index on the next trigger, e.g. after the trigger of an action changed
+    """
+    global trigger_index
+    trigger_index = None
+
+
+def get_triggered_actions(trigger: str) -> list[str]:
+    """
+    get the global actions which are played by the given trigger
+
+    Args:
+        trigger (str): trigger type, see TRIGGERS
+
+    Returns:
+        list[str]: ids of the global actions
+    """
+    global trigger_index, trigger_index_length
+    global_actions = get_preferences(bpy.context).global_actions
+    if trigger_index is None or trigger_index_length != len(global_actions):
+        trigger_index = {}
+        for action in global_actions:
+            if action.trigger != 'NONE':
+                trigger_index.setdefault(action.trigger, []).append(action.id)
+        trigger_index_length = len(global_actions)
+    return trigger_index.get(trigger, [])
+
+
+def fire(trigger: str) -> None:
+    """
+    queue all global actions of the given trigger.
+    an action is played at most once per its trigger interval,
+    triggers during the interval are coalesced into a single playback at the end of the interval
+
+    Args:
+        trigger (str): trigger type, see TRIGGERS
+    """
+    if trigger == 'DEPSGRAPH_UPDATE_POST' and dispatched:
+        return
+    if is_playback_running():
+        return
+    action_ids = get_triggered_actions(trigger)
+    if not action_ids:
+        return
+    global_actions = get_preferences(bpy.context).global_actions
+    now = time.monotonic()
+    for action_id in action_ids:
+        if action_id in pending:
+            continue
+        action = global_actions.get(action_id)
+        if action is None:
+            continue
+        pending.add(action_id)
+        delay = last_dispatch.get(action_id, -action.trigger_interval) + action.trigger_interval - now
+        if delay > 0:
+            timer = functools.partial(enqueue, action_id)
+            delayed.append(timer)
+            bpy.app.timers.register(timer, first_interval=delay, persistent=True)
+        else:
+            enqueue(action_id)
+
+
+def enqueue(action_id: str) -> None:
+    """
+    add the action to the dispatch queue
+
+    Args:
+        action_id (str): id of the global action
+    """
+    delayed[:] = [timer for timer in delayed if bpy.app.timers.is_registered(timer)]
+    dispatch_queue.append(action_id)
+    if not bpy.app.timers.is_registered(dispatch):
+        bpy.app.timers.register(dispatch, first_interval=0, persistent=True)
+
+
+def dispatch() -> None:
+    """
+    play all queued actions, called by a timer outside of the Blender handlers
+    """
+    context = bpy.context
+    global_actions = get_preferences(context).global_actions
+    while dispatch_queue:
+        action_id = dispatch_queue.popleft()
+        pending.discard(action_id)
+        action = global_actions.get(action_id)
+        if action is None or action.is_playing or action.trigger == 'NONE':
+            continue
+        last_dispatch[action_id] = time.monotonic()
+        dispatched.add(action_id)
+        err = play(context, action.macros, action, 'global_actions', undo_push=True)
+        if err:
+            logger.error("triggered action %s (%s): %s" % (action.label, action.trigger, err))
+    if dispatched and not bpy.app.timers.is_registered(release_dispatched):
+        bpy.app.timers.register(release_dispatched, first_interval=0, persistent=True)
+
+
+def release_dispatched() -> Optional[float]:
+    """
+    end the suppression of depsgraph triggers after the dispatched playbacks are finished
+    and the depsgraph updates caused by them are handled, called by a timer
+
+    Returns:
+        Optional[float]: interval until the next check, None if the suppression ended
+    """
+    global release_next
+    if any(get_session('global_actions', action_id) is not None for action_id in dispatched):
+        # paused or sliced playbacks continue in later timer calls
+        release_next = False
+        return 0.1
+    if not release_next:
+        # the depsgraph update of the last step is handled after the timers of the current event loop
+        release_next = True
+        return 0
+    release_next = False
+    dispatched.clear()
+    return None
+
+
+def create_handler(trigger: str):
+    """
+    create the Blender handler of the given trigger
+
+    Args:
+        trigger (str): trigger type, see TRIGGERS
+
+    Returns:
+        function: persistent handler
+    """
+    @persistent
+    def handler(*args) -> None:
+        fire(trigger)
+    return handler
+
+
+# handler functions (=value) accessed by the trigger type (=key)
+handlers = {trigger: create_handler(trigger) for trigger in TRIGGERS}
+
+
+def register_triggers() -> None:
+    """
+    append the trigger handlers to the Blender handlers
+    """
+    for trigger, handler_name in TRIGGERS.items():
+        getattr(bpy.app.handlers, handler_name).append(handlers[trigger])
+
+
+def unregister_triggers() -> None:
+    """
+    remove the trigger handlers and clear all queued triggers
+    """
+    for trigger, handler_name in TRIGGERS.items():
+        handler_list = getattr(bpy.app.handlers, handler_name)
+        if handlers[trigger] in handler_list:
+            handler_list.remove(handlers[trigger])
+    global release_next
+    for timer in [dispatch, release_dispatched, *delayed]:
+        if bpy.app.timers.is_registered(timer):
+            bpy.app.timers.unregister(timer)
+    delayed.clear()
+    dispatch_queue.clear()
+    pending.clear()
+    dispatched.clear()
+    release_next = False
+    invalidate_trigger_index()
+
+# endregion
@@ -32,7 +32,7 @@ class Log_system:
         dir = self.directory = os.path.join(os.path.dirname(os.path.dirname(__file__)), "logs")
         if not os.path.exists(dir):
             os.mkdir(dir)
-        all_logs = os.listdir(dir)
+        all_logs = get_log_files(dir)
         log_later = []
         while len(all_logs) >= count:
             try:
@@ -44,7 +44,7 @@ class Log_system:
             except FileNotFoundError as err:
                 log_later.append("For some reason the File doesn't exists %s" % str(err))
                 break
-            all_logs = os.listdir(dir)
+            all_logs = get_log_files(dir)
         name = ""
         for arg in sys.argv:
             if arg.endswith(".blend"):
@@ -89,6 +89,19 @@ class Log_system:
         self.file_handler = file_handler
 
 
+def get_log_files(directory: str) -> list[str]:
+    """
+    get the names of the log files in the given directory, other files (e.g. exported profiles) are ignored
+
+    Args:
+        directory (str): log directory
+
+    Returns:
+        list[str]: names of the log files
+    """
+    return [filename for filename in os.listdir(directory) if filename.endswith(".log")]
+
+
 def update_log_amount_in_config(amount: int) -> None:
     """
     writes given amount as log amount into the config file
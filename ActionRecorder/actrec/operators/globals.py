@@ -523,7 +523,7 @@ class AR_OT_global_export(Operator, ExportHelper):
                 data['actions'].append(functions.property_to_python(
                     action,
                     exclude=["name", "selected", "alert", "macros.name",
-                             "macros.is_available", "macros.alert", "is_playing"]
+                             "macros.is_available", "macros.alert", "is_playing", "has_checkpoint", "progress"]
                 ))
 
         if self.include_keymap:
@@ -568,6 +568,35 @@ class AR_OT_global_export(Operator, ExportHelper):
                     sub_col.label(text=action.shortcut)
 
 
+class AR_OT_global_export_python(Operator, ExportHelper):
+    bl_idname = "ar.global_export_python"
+    bl_label = "Export as Python"
+    bl_description = (
+        "Export the selected Actions as a python module, which runs without the add-on"
+        " (blender -b <file.blend> --python <module>)"
+    )
+
+    filter_glob: StringProperty(default='*.py', options={'HIDDEN'})
+    filename_ext = ".py"
+
+    @classmethod
+    def poll(cls, context: Context) -> bool:
+        ActRec_pref = get_preferences(context)
+        return len(ActRec_pref.global_actions) and len(functions.get_global_selected_ids())
+
+    def execute(self, context: Context) -> set[str]:
+        ActRec_pref = get_preferences(context)
+        logger.info("Global Export Python: file=%s", self.filepath)
+        if not os.path.exists(os.path.dirname(self.filepath)):
+            self.report({'ERROR'}, "Directory doesn't exist")
+            return {'CANCELLED'}
+        actions = [ActRec_pref.global_actions[id] for id in functions.get_global_selected_ids()]
+        with open(self.filepath, 'w', encoding='utf-8') as python_file:
+            python_file.write(functions.generate_module(actions))
+        self.report({'INFO'}, "Exported %i Actions to %s" % (len(actions), self.filepath))
+        return {"FINISHED"}
+
+
 class AR_OT_global_save(Operator):
     bl_idname = "ar.global_save"
     bl_label = "Save"
@@ -615,7 +644,7 @@ class AR_OT_global_to_local(shared.Id_based, Operator):
         data = functions.property_to_python(
             action,
             exclude=["name", "alert", "macros.name", "macros.alert",
-                     "macros.is_available", "macros.is_playing", "is_playing"]
+                     "macros.is_available", "macros.is_playing", "is_playing", "has_checkpoint", "progress"]
         )
         data["id"] = id
         functions.add_data_to_collection(ActRec_pref.local_actions, data)
@@ -716,7 +745,7 @@ class AR_OT_global_move_down(shared.Id_based, Operator):
         return {"FINISHED"}
 
 
-class AR_OT_global_execute_action(shared.Id_based, Operator):
+class AR_OT_global_execute_action(shared.Id_based, shared.Playback_based, Operator):
     bl_idname = 'ar.global_execute_action'
     bl_label = 'ActRec Action Button'
     bl_description = 'Play this Action Button'
@@ -739,10 +768,30 @@ class AR_OT_global_execute_action(shared.Id_based, Operator):
         if action.is_playing:
             self.report({'INFO'}, "The action is already playing!")
             return {'CANCELLED'}
-        err = functions.play(context, action.macros, action, 'global_actions')
-        if err:
-            self.report({'ERROR'}, str(err))
-        return {'FINISHED'}
+        return self.play_action(context, action, 'global_actions')
+
+
+class AR_OT_global_resume_action(shared.Id_based, shared.Playback_based, Operator):
+    bl_idname = 'ar.global_resume_action'
+    bl_label = 'Resume from Failure'
+    bl_description = 'Continue the last failed playback of this Action Button from the failed macro'
+    bl_options = {'UNDO', 'INTERNAL'}
+
+    @classmethod
+    def poll(cls, context: Context) -> bool:
+        return len(functions.checkpoints)
+
+    def execute(self, context: Context) -> set[str]:
+        ActRec_pref = get_preferences(context)
+        id = functions.get_global_action_id(ActRec_pref, self.id, self.index)
+        self.clear()
+        action = ActRec_pref.global_actions.get(id) if id else None
+        if action is None or not action.has_checkpoint:
+            return {'CANCELLED'}
+        if action.is_playing:
+            self.report({'INFO'}, "The action is already playing!")
+            return {'CANCELLED'}
+        return self.play_action(context, action, 'global_actions', resume=True)
 
 
 class AR_OT_global_icon(icon_manager.Icontable, shared.Id_based, Operator):
@@ -874,6 +923,7 @@ classes = [
     AR_OT_global_import,
     AR_OT_global_import_settings,
     AR_OT_global_export,
+    AR_OT_global_export_python,
     AR_OT_global_save,
     AR_OT_global_load,
     AR_OT_global_to_local,
@@ -881,6 +931,7 @@ classes = [
     AR_OT_global_move_up,
     AR_OT_global_move_down,
     AR_OT_global_execute_action,
+    AR_OT_global_resume_action,
     AR_OT_global_icon,
     AR_OT_add_ar_shortcut,
     AR_OT_remove_ar_shortcut,
@@ -1,14 +1,15 @@
 # region Imports
 # external modules
+import os
 import json
 import uuid
-import numpy
 from typing import TYPE_CHECKING
 
 # blender modules
 import bpy
 from bpy.types import Operator, Context, Event, AddonPreferences, OperatorProperties, PropertyGroup
-from bpy.props import StringProperty, IntProperty, EnumProperty, CollectionProperty
+from bpy.props import StringProperty, EnumProperty, CollectionProperty
+from bpy_extras.io_utils import ExportHelper
 
 # relative imports
 from .. import functions, properties, icon_manager, shared_data
@@ -120,7 +121,7 @@ class AR_OT_local_to_global(Operator):
         data = functions.property_to_python(
             action,
             exclude=["name", "alert", "macros.name", "macros.alert",
-                     "macros.is_available", "macros.is_playing", "is_playing"]
+                     "macros.is_available", "macros.is_playing", "is_playing", "has_checkpoint", "progress"]
         )
         data["id"] = id
         data["selected"] = True
@@ -430,7 +431,7 @@ class AR_OT_local_selection_down(Operator):
         return {'FINISHED'}
 
 
-class AR_OT_local_play(shared.Id_based, Operator):
+class AR_OT_local_play(shared.Id_based, shared.Playback_based, Operator):
     bl_idname = 'ar.local_play'
     bl_label = 'ActRec Play'
     bl_description = 'Play the selected Action.'
@@ -456,11 +457,33 @@ class AR_OT_local_play(shared.Id_based, Operator):
         if action.is_playing:
             self.report({'INFO'}, "The action is already playing!")
             return {'CANCELLED'}
-        err = functions.play(context, action.macros, action, 'local_actions')
-        if err:
-            self.report({'ERROR'}, str(err))
         self.clear()
-        return {'FINISHED'}
+        return self.play_action(context, action, 'local_actions')
+
+
+class AR_OT_local_resume(shared.Id_based, shared.Playback_based, Operator):
+    bl_idname = 'ar.local_resume'
+    bl_label = 'Resume from Failure'
+    bl_description = 'Continue the last failed playback of the selected Action from the failed macro'
+    bl_options = {'REGISTER', 'UNDO'}
+
+    @classmethod
+    def poll(cls, context: Context) -> bool:
+        ActRec_pref = get_preferences(context)
+        return len(functions.checkpoints) and not ActRec_pref.local_record_macros
+
+    def execute(self, context: Context) -> set[str]:
+        ActRec_pref = get_preferences(context)
+        index = functions.get_local_action_index(ActRec_pref, self.id, self.index)
+        action = ActRec_pref.local_actions[index]
+        self.clear()
+        if action.is_playing:
+            self.report({'INFO'}, "The action is already playing!")
+            return {'CANCELLED'}
+        if not action.has_checkpoint:
+            self.report({'INFO'}, "The action has no failed playback to resume")
+            return {'CANCELLED'}
+        return self.play_action(context, action, 'local_actions', resume=True)
 
 
 class AR_OT_local_record(shared.Id_based, Operator):
@@ -469,7 +492,6 @@ class AR_OT_local_record(shared.Id_based, Operator):
     bl_options = {'UNDO'}
 
     ignore_selection = False
-    record_start_index: IntProperty()
 
     @classmethod
     def description(cls, context: Context, properties: OperatorProperties) -> str:
@@ -496,18 +518,58 @@ class AR_OT_local_record(shared.Id_based, Operator):
         if ActRec_pref.local_record_macros:  # start recording
             self.id = action.id
             self.index = index
-            self.record_start_index = functions.get_report_text(context).count('\n')
+            # only the reports of the recording are read when it stops
+            functions.read_new_reports(context, copy=False)
+            shared_data.snapshot_reports.clear()
+            shared_data.snapshot_cache.clear()
             context.scene.ar.record_undo_end = not context.scene.ar.record_undo_end
             return {"FINISHED"}
 
         # end recording and add reports as macros
-        reports = functions.get_report_text(context).splitlines()[self.record_start_index:]
-        reports = [report for report in reports if report.startswith('bpy.')]
-        if not len(reports):
+        if ActRec_pref.record_engine == 'SNAPSHOT':
+            functions.capture_record_reports(context)
+            data = functions.get_snapshot_record_data(context)
+        else:
+            reports = functions.read_new_reports(context)
+            reports = [report for report in reports if report.startswith('bpy.')]
+            data = self.replay_reports(context, reports) if reports else []
+        shared_data.tracked_actions.clear()
+        if not len(data):
             self.clear()
             return {"FINISHED"}
-        reports = numpy.array(functions.merge_report_tracked(reports, shared_data.tracked_actions), dtype=object)
-        shared_data.tracked_actions.clear()
+        context = bpy.context
+
+        error_reports = []
+        action = ActRec_pref.local_actions[index]
+        recorded_start = len(action.macros)
+        for report in data:
+            functions.add_report_as_macro(context, ActRec_pref, action, report, error_reports)
+        if error_reports:
+            self.report({'ERROR'}, "Not all reports could be added added:\n%s" % "\n".join(error_reports))
+        if ActRec_pref.local_record_optimize:
+            rewrites = functions.optimize_macros(action.macros, recorded_start)
+            functions.apply_rewrites(action.macros, rewrites)
+            logger.info("Optimize Recording: %s", rewrites)
+        functions.save_local_to_scene(ActRec_pref, bpy.context.scene)
+        if not ActRec_pref.hide_local_text:
+            functions.local_action_to_text(action)
+        context.area.tag_redraw()
+        self.clear()
+        return {"FINISHED"}
+
+    def replay_reports(self, context: Context, reports: list[str]) -> list[str]:
+        """
+        complete the reports of the recording (record engine "UNDO"),
+        undo the recording and redo it step by step to compare the changed properties before and after the change
+
+        Args:
+            context (Context): active blender context
+            reports (list[str]): reports of the recording
+
+        Returns:
+            list[str]: commands of the recording
+        """
+        reports = functions.merge_report_tracked(reports, shared_data.tracked_actions)
         logger.info("Record Reports: %s", reports)
 
         record_undo_end = context.scene.ar.record_undo_end
@@ -573,20 +635,7 @@ class AR_OT_local_record(shared.Id_based, Operator):
 
         while redo_steps > 0 and bpy.ops.ed.redo.poll():
             bpy.ops.ed.redo()
-        context = bpy.context
-
-        error_reports = []
-        action = ActRec_pref.local_actions[index]
-        for report in data:
-            functions.add_report_as_macro(context, ActRec_pref, action, report, error_reports)
-        if error_reports:
-            self.report({'ERROR'}, "Not all reports could be added added:\n%s" % "\n".join(error_reports))
-        functions.save_local_to_scene(ActRec_pref, bpy.context.scene)
-        if not ActRec_pref.hide_local_text:
-            functions.local_action_to_text(action)
-        context.area.tag_redraw()
-        self.clear()
-        return {"FINISHED"}
+        return data
 
 
 class AR_OT_local_icon(icon_manager.Icontable, shared.Id_based, Operator):
@@ -657,6 +706,104 @@ class AR_OT_local_clear(shared.Id_based, Operator):
         bpy.context.area.tag_redraw()
         self.clear()
         return {"FINISHED"}
+
+
+class AR_OT_local_optimize(shared.Id_based, Operator):
+    bl_idname = "ar.local_optimize"
+    bl_label = "Optimize Action"
+    bl_description = (
+        "Remove redundant Macros of the selected Action without changing the result,"
+        " e.g. overwritten assignments or consecutive transforms"
+    )
+    bl_options = {'UNDO'}
+
+    @classmethod
+    def poll(cls, context: Context) -> bool:
+        ActRec_pref = get_preferences(context)
+        return (
+            len(ActRec_pref.local_actions)
+            and len(ActRec_pref.local_actions[ActRec_pref.active_local_action_index].macros)
+            and not ActRec_pref.local_record_macros
+        )
+
+    def invoke(self, context: Context, event: Event) -> set[str]:
+        ActRec_pref = get_preferences(context)
+        index = functions.get_local_action_index(ActRec_pref, self.id, self.index)
+        action = ActRec_pref.local_actions[index]
+        self.id = action.id
+        self.rewrites = functions.optimize_macros(action.macros)
+        if not self.rewrites:
+            self.report({'INFO'}, "The action is already optimized")
+            self.clear()
+            return {'CANCELLED'}
+        return context.window_manager.invoke_props_dialog(self, width=600)
+
+    def draw(self, context: Context) -> None:
+        ActRec_pref = get_preferences(context)
+        action = ActRec_pref.local_actions[self.id]
+        layout = self.layout
+        removed = sum(rewrite.kind == 'REMOVE' for rewrite in self.rewrites)
+        layout.label(text="%i of %i Macros are removed" % (removed, len(action.macros)))
+        box = layout.box()
+        for rewrite in self.rewrites:
+            macro = action.macros[rewrite.index]
+            col = box.column(align=True)
+            if rewrite.kind == 'REMOVE':
+                col.label(text="%i. %s: %s" % (rewrite.index + 1, macro.label, rewrite.reason), icon='REMOVE')
+            else:
+                col.label(text="%i. %s: %s" % (rewrite.index + 1, macro.label, rewrite.reason), icon='MODIFIER')
+                col.label(text=macro.command, icon='BLANK1')
+                col.label(text=rewrite.command, icon='FORWARD')
+
+    def execute(self, context: Context) -> set[str]:
+        ActRec_pref = get_preferences(context)
+        index = functions.get_local_action_index(ActRec_pref, self.id, self.index)
+        action = ActRec_pref.local_actions[index]
+
+        if action.is_playing:
+            self.report({'INFO'}, "The action is playing and can not be edited!")
+            return {'CANCELLED'}
+
+        rewrites = functions.optimize_macros(action.macros)
+        functions.apply_rewrites(action.macros, rewrites)
+        logger.info("Optimize Action %s: %s", action.label, rewrites)
+        functions.save_local_to_scene(ActRec_pref, context.scene)
+        if not ActRec_pref.hide_local_text:
+            functions.local_action_to_text(action)
+        context.area.tag_redraw()
+        self.clear()
+        return {"FINISHED"}
+
+
+class AR_OT_local_export_python(shared.Id_based, Operator, ExportHelper):
+    bl_idname = "ar.local_export_python"
+    bl_label = "Export as Python"
+    bl_description = (
+        "Export the selected Action as a python module, which runs without the add-on"
+        " (blender -b <file.blend> --python <module>)"
+    )
+
+    filter_glob: StringProperty(default='*.py', options={'HIDDEN'})
+    filename_ext = ".py"
+
+    @classmethod
+    def poll(cls, context: Context) -> bool:
+        ActRec_pref = get_preferences(context)
+        return len(ActRec_pref.local_actions) and not ActRec_pref.local_record_macros
+
+    def execute(self, context: Context) -> set[str]:
+        ActRec_pref = get_preferences(context)
+        index = functions.get_local_action_index(ActRec_pref, self.id, self.index)
+        action = ActRec_pref.local_actions[index]
+        logger.info("Local Export Python: file=%s", self.filepath)
+        if not os.path.exists(os.path.dirname(self.filepath)):
+            self.report({'ERROR'}, "Directory doesn't exist")
+            return {'CANCELLED'}
+        with open(self.filepath, 'w', encoding='utf-8') as python_file:
+            python_file.write(functions.generate_module([action]))
+        self.report({'INFO'}, "Exported %s to %s" % (action.label, self.filepath))
+        self.clear()
+        return {"FINISHED"}
 # endregion
 
 
@@ -670,9 +817,12 @@ classes = [
     AR_OT_local_selection_up,
     AR_OT_local_selection_down,
     AR_OT_local_play,
+    AR_OT_local_resume,
     AR_OT_local_record,
     AR_OT_local_icon,
-    AR_OT_local_clear
+    AR_OT_local_clear,
+    AR_OT_local_optimize,
+    AR_OT_local_export_python
 ]
 
 # region Registration
@@ -3,7 +3,7 @@
 import importlib
 import json
 import time
-import numpy
+from itertools import islice
 import threading
 from typing import Optional
 from logging import Logger
@@ -40,7 +40,6 @@ class AR_OT_macro_add(shared.Id_based, Operator):
     bl_options = {'UNDO'}
 
     command: StringProperty(default="")
-    report_length: IntProperty(default=0)
 
     @classmethod
     def poll(cls, context: Context) -> bool:
@@ -65,11 +64,9 @@ class AR_OT_macro_add(shared.Id_based, Operator):
         command = None
 
         if not self.command:  # get the command from the latest Blender report
-            reports = functions.get_report_text(context).splitlines()
-            length = len(reports)
-            if self.report_length != length:
+            reports = functions.read_new_reports(context)
+            if reports:
                 new_report = True
-                self.report_length = length
                 reports.reverse()
                 for report in reports:
                     if report.startswith(("bpy.ops.", "bpy.context.")):
@@ -87,12 +84,11 @@ class AR_OT_macro_add(shared.Id_based, Operator):
             if command.startswith("bpy.context."):
                 tracked_actions = []
                 if not self.command:
-                    tracked_actions = numpy.array(shared_data.tracked_actions)[::-1]
-                    i = 0
-                    len_tracked = len(tracked_actions)
-                    while i < len_tracked and tracked_actions[i][2] != "CONTEXT":
-                        i += 1
-                    tracked_actions = tracked_actions[:i + 1]
+                    # newest tracked operators up to the last property change
+                    for tracked in reversed(shared_data.tracked_actions):
+                        tracked_actions.append(tracked)
+                        if tracked[2] == "CONTEXT":
+                            break
                 reports = functions.merge_report_tracked([command], tracked_actions)
                 logger.info("Record Report: %s" % reports)
 
@@ -119,19 +115,17 @@ class AR_OT_macro_add(shared.Id_based, Operator):
             elif command.startswith("bpy.ops."):
                 ops_type, ops_name, ops_values = functions.split_operator_report(command)
                 if not self.command:
-                    tracked_actions = numpy.array(shared_data.tracked_actions)[::-1]
-                    i = 0
-                    len_tracked = len(tracked_actions)
-                    if len_tracked > i:
-                        tracked = tracked_actions[i]
-                        i += 1
+                    # newest tracked operators up to the operator of the command and the one before it
+                    tracked_iterator = reversed(shared_data.tracked_actions)
+                    tracked_actions = []
+                    for tracked in tracked_iterator:
+                        tracked_actions.append(tracked)
                         # compare tracked operator data with the command operator data
-                        while (not (tracked[2] == "%s_OT_%s" % (ops_type.upper(), ops_name)
-                                    and functions.compare_op_dict(ops_values, tracked[3]))
-                               and len_tracked > i):
-                            tracked = tracked_actions[i]
-                            i += 1
-                    reports = functions.merge_report_tracked([command], tracked_actions[:i + 1])
+                        if (tracked[2] == "%s_OT_%s" % (ops_type.upper(), ops_name)
+                                and functions.compare_op_dict(ops_values, tracked[3])):
+                            break
+                    tracked_actions.extend(islice(tracked_iterator, 1))
+                    reports = functions.merge_report_tracked([command], tracked_actions)
                     logger.info("Record Report: %s" % reports)
                 else:  # convert command to simple incase the command was passthrough with the operator
                     bl_options = getattr(getattr(bpy.ops, ops_type), ops_name).bl_options
@@ -220,6 +214,11 @@ class AR_OT_macro_add_event(shared.Id_based, Operator):
         default=False
     )
     script_name: StringProperty(name="Text", description="Chose a Text to convert into a macro script")
+    keep_namespace: BoolProperty(
+        name="Keep Variables",
+        description="Keep the variables of the script between its executions in the same playback, e.g. inside a Loop",
+        default=False
+    )
 
     macro_index: IntProperty(name="Macro Index", default=-1)
 
@@ -264,6 +263,7 @@ class AR_OT_macro_add_event(shared.Id_based, Operator):
             op.id = self.id
             op.index = self.index
             op.macro_index = self.macro_index
+            box.prop(self, 'keep_namespace')
 
     def check(self, context: Context) -> None:
         while (index := self.objects.find("")) >= 0:
@@ -318,6 +318,7 @@ class AR_OT_macro_add_event(shared.Id_based, Operator):
                 else:
                     data['ScriptName'] = text.name.replace("[ActRec Macro]", "").strip()
                     data['ScriptText'] = "\n".join(line.body for line in text.lines)
+                data['KeepNamespace'] = self.keep_namespace
             macro.command = "ar.event: %s" % json.dumps(data)
         functions.save_local_to_scene(ActRec_pref, context.scene)
         if not ActRec_pref.hide_local_text:
@@ -880,7 +881,8 @@ class AR_OT_macro_edit(Macro_based, Operator):
                         'keep_selection': data['KeepSelection']
                     },
                     'Run Script': lambda: {
-                        'script_name': data['ScriptName']
+                        'script_name': data['ScriptName'],
+                        'keep_namespace': data.get('KeepNamespace', False)
                     }
                 }
                 data_type = data['Type']
@@ -2,7 +2,12 @@
 # blender modules
 import bpy
 from bpy.types import Operator, Context, Event
-from bpy.props import StringProperty, IntProperty
+from bpy.props import StringProperty, IntProperty, BoolProperty, EnumProperty
+
+# relative imports
+from .. import functions
+from ..functions.shared import get_preferences
+from ..log import log_sys
 # endregion
 
 
@@ -32,6 +37,113 @@ class Id_based(Operator):
         self.index = -1
 
 
+class Playback_based(Operator):
+    """
+    plays an action, an action which doesn't finish at once (Sliced playback mode, Timer event)
+    keeps the operator running to show the progress and to cancel the playback with Esc
+    """
+    profile: BoolProperty(
+        name="Profile",
+        description="Records the time, calls and errors of every macro, shown in the Macro Editor",
+        default=False,
+        options={'SKIP_SAVE'}
+    )
+
+    def play_action(self, context: Context, action, action_type: str, resume: bool = False) -> set[str]:
+        """
+        play the given action
+
+        Args:
+            context (Context): active blender context
+            action (AR_action): action to play
+            action_type (str): action type of the given action
+            resume (bool, optional): continue the last failed playback from the failed macro. Defaults to False.
+
+        Returns:
+            set[str]: operator return value
+        """
+        budget = None
+        if action.playback_mode == 'SLICED' and context.window and not functions.is_playback_running():
+            ActRec_pref = get_preferences(context)
+            budget = ActRec_pref.playback_slice_budget / 1000
+        if resume:
+            err = functions.resume(context, action, action_type, budget=budget, profile=self.profile)
+        else:
+            err = functions.play(context, action.macros, action, action_type, budget=budget, profile=self.profile)
+        if err:
+            self.report({'ERROR'}, str(err))
+            return {'FINISHED'}
+        self.session = functions.get_session(action_type, action.id)
+        if self.session is None or not context.window:
+            self.report_skipped_writes(action_type, action.id)
+            return {'FINISHED'}
+        # wait for the session, the undo step of this operator contains the complete playback
+        self.session.undo_owned = True
+        context.window_manager.modal_handler_add(self)
+        self.timer = context.window_manager.event_timer_add(0.1, window=context.window)
+        return {'RUNNING_MODAL'}
+
+    def modal(self, context: Context, event: Event) -> set[str]:
+        if event.type == 'ESC' and event.value == 'PRESS':
+            # the session may have finished since the last timer event
+            if not self.session.finished:
+                self.session.cancel(context)
+        elif event.type != 'TIMER':
+            return {'PASS_THROUGH'}
+
+        if context.area:
+            context.area.tag_redraw()
+        if not self.session.finished:
+            return {'RUNNING_MODAL'}
+
+        context.window_manager.event_timer_remove(self.timer)
+        if self.session.error:
+            self.report({'ERROR'}, str(self.session.error))
+        self.report_skipped_writes(*self.session.action_key)
+        return {'FINISHED'}
+
+    def report_skipped_writes(self, action_type: str, action_id: str) -> None:
+        """
+        report the number of unchanged assignments the last playback of the action skipped
+
+        Args:
+            action_type (str): action type of the played action
+            action_id (str): id of the played action
+        """
+        skipped = functions.skipped_writes.pop((action_type, action_id), 0)
+        if skipped:
+            self.report({'INFO'}, "Skipped %i unchanged assignments" % skipped)
+
+
+class AR_OT_export_profile(Operator):
+    bl_idname = "ar.export_profile"
+    bl_label = "Export Profile"
+    bl_description = "Writes the last profile of the action next to the log files"
+    bl_options = {"INTERNAL"}
+
+    id: StringProperty(name="id", description="id of the profiled action")
+    action_type: StringProperty(name="action type", description="action type of the profiled action")
+    file_format: EnumProperty(
+        items=[("JSON", "JSON", "Export as JSON file"),
+               ("CSV", "CSV", "Export as CSV file")],
+        name="Format",
+        default="JSON"
+    )
+
+    @classmethod
+    def poll(cls, context: Context) -> bool:
+        return len(functions.profiles)
+
+    def execute(self, context: Context) -> set[str]:
+        profile = functions.profiles.get((self.action_type, self.id))
+        if profile is None:
+            self.report({'ERROR'}, "The action has no profile, play it with Profile enabled")
+            return {"CANCELLED"}
+        path = profile.export(log_sys.directory, self.file_format)
+        self.report({'INFO'}, "Exported profile to %s" % path)
+        return {"FINISHED"}
+
+
 class AR_OT_copy_text(Operator):
     bl_idname = "ar.copy_text"
     bl_label = "Copy Text"
@@ -53,6 +165,7 @@ class AR_OT_copy_text(Operator):
 
 classes = [
     AR_OT_check_ctrl,
+    AR_OT_export_profile,
     AR_OT_copy_text
 ]
 
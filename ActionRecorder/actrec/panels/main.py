@@ -8,6 +8,8 @@ from .. import config
 from .. import update
 from ..log import log_sys
 from ..functions.shared import get_preferences
+from ..functions.profiler import profiles
+from ..ui_functions.profiler import draw_profile
 # endregion
 
 classes = []
@@ -52,6 +54,7 @@ def panel_factory(space_type: str):
             col2 = col.column(align=True)
             col2.operator("ar.local_move_up", text='', icon='TRIA_UP')
             col2.operator("ar.local_move_down", text='', icon='TRIA_DOWN')
+            col.operator("ar.local_export_python", text='', icon='SCRIPT')
     AR_PT_local.__name__ = "AR_PT_local_%s" % space_type
 
     class AR_PT_macro(Panel):
@@ -103,10 +106,26 @@ def panel_factory(space_type: str):
                 row2 = row.row(align=True)
                 row2.operator("ar.local_record", text='Record', icon='REC')
                 row2.operator("ar.local_clear", text='Clear')
+                row2.operator("ar.local_optimize", text='', icon='SHADERFX')
                 col = layout.column()
                 row = col.row()
                 row.scale_y = 2
-                row.operator("ar.local_play", text="Playing..." if selected_action.is_playing else "Play")
+                if selected_action.is_playing and selected_action.playback_mode == 'SLICED':
+                    row.progress(
+                        factor=selected_action.progress,
+                        text="Playing... %i%% (Esc to cancel)" % (selected_action.progress * 100)
+                    )
+                else:
+                    op = row.operator("ar.local_play", text="Playing..." if selected_action.is_playing else "Play")
+                    op.profile = ActRec_pref.playback_profile
+                row.prop(selected_action, 'playback_mode', text="", icon_only=True)
+                row.prop(selected_action, 'undo_mode', text="", icon_only=True)
+                row.prop(ActRec_pref, 'playback_profile', text="", icon='SORTTIME')
+                if selected_action.has_checkpoint and not selected_action.is_playing:
+                    op = col.operator("ar.local_resume", icon='RECOVER_LAST')
+                    op.profile = ActRec_pref.playback_profile
+                if ActRec_pref.playback_profile and (profile := profiles.get((selected_action.action_type, selected_action.id))):
+                    draw_profile(col.box(), profile)
                 col.operator("ar.local_to_global", text='Local to Global')
                 row = col.row(align=True)
                 row.enabled = bpy.ops.ar.local_to_global.poll()
@@ -251,6 +270,7 @@ def panel_factory(space_type: str):
             col.label(text="Data Management", icon='FILE_FOLDER')
             col.operator("ar.global_import", text='Import')
             col.operator("ar.global_export", text='Export')
+            col.operator("ar.global_export_python", text='Export as Python', icon='SCRIPT')
             col.label(text="Storage File Settings", icon="FOLDER_REDIRECT")
             row = col.row()
             row.label(text="AutoSave")
@@ -277,6 +297,7 @@ def panel_factory(space_type: str):
                 'local_create_empty',
                 text="Create Empty Macro on Error"
             )
+            col.prop(ActRec_pref, 'local_record_optimize')
     AR_PT_advanced.__name__ = "AR_PT_advanced_%s" % space_type
 
     global classes
@@ -258,6 +258,22 @@ class AR_preferences(AddonPreferences):
         update=update_local_create_empty
     )
 
+    local_record_optimize: BoolProperty(
+        default=False,
+        name="Optimize Recording",
+        description="Remove redundant Macros of a recording when the recording stops, see Optimize Action"
+    )
+    record_engine: EnumProperty(
+        items=[("UNDO", "Undo/Redo",
+                "Steps through the recording with undo and redo when it stops to complete the property changes"),
+               ("SNAPSHOT", "Snapshot",
+                "Completes the property changes during the recording from snapshots of the changed properties,"
+                " without undo and redo. Needs an open Info editor, otherwise the changes are completed at the end")],
+        name="Record Engine",
+        description="How the recorded property changes are completed",
+        default="UNDO"
+    )
+
     # ---------------- macros ----------------
 
     last_macro_label: StringProperty(name="last label", default="label of the last macro")
@@ -265,6 +281,19 @@ class AR_preferences(AddonPreferences):
 
     operators_list_length: IntProperty(name="INTERNAL", default=0)
 
+    def update_tracked_operators_size(self, context: Context) -> None:
+        functions.resize_tracked_actions(self.tracked_operators_size)
+
+    tracked_operators_size: IntProperty(
+        name="Tracked Operators",
+        description="Number of executed operators which are kept to improve new Macros,"
+        " the oldest operators are dropped first",
+        default=1024,
+        min=16,
+        soft_max=8192,
+        update=update_tracked_operators_size
+    )
+
     multiline_support_installing: BoolProperty(name="INTERNAL", default=False)
     multiline_support_dont_ask: BoolProperty(
         name="Don't Ask Again",
@@ -273,6 +302,35 @@ Can also be installed under Preferences > Add-ons > Action Recorder > Settings""
         default=False
     )
 
+    # ---------------- playback ----------------
+
+    playback_slice_budget: IntProperty(
+        name="Slice Budget",
+        description="Time in milliseconds an action in Sliced playback mode runs before Blender updates the UI",
+        default=12,
+        min=1,
+        soft_max=100
+    )
+    undo_mode: EnumProperty(
+        items=[("ACTION", "Action",
+                "The whole playback is a single undo step, Ctrl+Z reverts the complete action"),
+               ("MACRO", "Macro", "Every operator macro pushes its own undo step")],
+        name="Undo Mode",
+        description="Default of how the playback of an action is added to the undo history",
+        default="ACTION"
+    )
+    playback_profile: BoolProperty(
+        name="Profile",
+        description="Profile the played actions, records the time, calls and errors of every macro",
+        default=False
+    )
+    playback_skip_unchanged: BoolProperty(
+        name="Skip Unchanged Values",
+        description="Context assignments (e.g. modifier toggles) aren't executed if the value is already set,"
+        " floats are compared with the precision of the recorded value",
+        default=False
+    )
+
     # ---------------- globals ----------------
 
     global_actions: CollectionProperty(type=properties.AR_global_actions)
@@ -484,6 +542,19 @@ Can also be installed under Preferences > Add-ons > Action Recorder > Settings""
             row = col.row()
             row.prop(self, 'hide_local_text')
             row.prop(self, 'local_create_empty')
+            row = col.row()
+            row.prop(self, 'local_record_optimize')
+            row.prop(self, 'tracked_operators_size')
+            row = col.row()
+            row.prop(self, 'record_engine')
+            row = col.row()
+            row.label(text="Scene Tracking: %i operators converted, %i updates without changes" % (
+                shared_data.tracking_counts['serialized'], shared_data.tracking_counts['unchanged']))
+            row = col.row()
+            row.prop(self, 'playback_slice_budget')
+            row.prop(self, 'undo_mode')
+            row = col.row()
+            row.prop(self, 'playback_skip_unchanged')
             if importlib.util.find_spec('fontTools') is None:
                 row = col.row()
                 if self.multiline_support_installing:
@@ -1,8 +1,8 @@
 # region Imports
 # blender modules
 import bpy
-from bpy.types import PropertyGroup
-from bpy.props import BoolProperty, StringProperty, CollectionProperty, EnumProperty
+from bpy.types import PropertyGroup, Context
+from bpy.props import BoolProperty, StringProperty, CollectionProperty, EnumProperty, FloatProperty
 
 # relative Imports
 from . import shared
@@ -14,6 +14,8 @@ from ..functions.shared import get_preferences
 
 
 class AR_global_actions(shared.AR_action, PropertyGroup):
+    # name of the collection in the preferences, the action type of playbacks
+    action_type = 'global_actions'
 
     def get_selected(self) -> bool:
         """
@@ -64,6 +66,33 @@ class AR_global_actions(shared.AR_action, PropertyGroup):
         name='Select'
     )
 
+    def update_trigger(self, context: Context) -> None:
+        functions.invalidate_trigger_index()
+
+    trigger: EnumProperty(
+        items=[("NONE", "None", "The action is only played manually", "BLANK1", 0),
+               ("SAVE_POST", "Save", "Plays the action after the file is saved", "FILE_TICK", 1),
+               ("FRAME_CHANGE_POST", "Frame Change", "Plays the action after the frame changed", "TIME", 2),
+               ("LOAD_POST", "Load", "Plays the action after a file is loaded", "FILE_FOLDER", 3),
+               ("DEPSGRAPH_UPDATE_POST", "Scene Update",
+                "Plays the action after the scene is updated (depsgraph update)", "SCENE_DATA", 4),
+               ("RENDER_COMPLETE", "Render Complete", "Plays the action after a render is completed",
+                "IMAGE_RGB_ALPHA", 5)],
+        name="Trigger",
+        description="Plays the action automatically on the chosen Blender event",
+        default="NONE",
+        update=update_trigger
+    )
+    trigger_interval: FloatProperty(
+        name="Trigger Interval",
+        description="""Minimum time between two triggered playbacks of the action.
+Triggers inside the interval are combined into a single playback""",
+        default=0.5,
+        min=0,
+        soft_max=60,
+        unit='TIME'
+    )
+
 
 class AR_global_import_action(PropertyGroup):
     def get_use(self) -> bool:
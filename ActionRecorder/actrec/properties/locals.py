@@ -14,6 +14,9 @@ from .. import functions
 
 
 class AR_local_actions(shared.AR_action, PropertyGroup):
+    # name of the collection in the preferences, the action type of playbacks
+    action_type = 'local_actions'
+
     def get_active_macro_index(self) -> int:
         """
         get the active index of the local macro.
@@ -1,11 +1,14 @@
 # region Imports
 # external modules
+from typing import Optional
+from contextlib import suppress
 import uuid
+import time
 
 # blender modules
 import bpy
 from bpy.types import PropertyGroup, Context
-from bpy.props import StringProperty, IntProperty, CollectionProperty, BoolProperty, EnumProperty
+from bpy.props import StringProperty, IntProperty, FloatProperty, CollectionProperty, BoolProperty, EnumProperty
 
 # relative imports
 from .. import functions
@@ -15,6 +18,28 @@ from ..icon_manager import get_icons_name_map, get_icons_value_map, get_custom_i
 
 # region PropertyGroups
 
+# alerts to reset (=value) accessed by the pointer of the property (=key), value format: (property, reset time)
+alert_resets = {}
+
+
+def reset_alerts() -> Optional[float]:
+    """
+    shared timer of all alerts, resets every alert which is shown for 1 second
+
+    Returns:
+        Optional[float]: time until the next alert needs to be reset, None if no alert is left
+    """
+    now = time.monotonic()
+    for key, (item, reset_time) in list(alert_resets.items()):
+        if reset_time > now:
+            continue
+        del alert_resets[key]
+        with suppress(ReferenceError):
+            item['alert'] = False
+    if not alert_resets:
+        return None
+    return max(min(reset_time for item, reset_time in alert_resets.values()) - now, 0.01)
+
 
 class Id_based:
     def get_id(self) -> str:
@@ -70,9 +95,9 @@ class Alert_system:
         """
         self['alert'] = value
         if value:
-            def reset() -> None:
-                self['alert'] = False
-            bpy.app.timers.register(reset, first_interval=1, persistent=True)
+            alert_resets[self.as_pointer()] = (self, time.monotonic() + 1)
+            if not bpy.app.timers.is_registered(reset_alerts):
+                bpy.app.timers.register(reset_alerts, first_interval=1, persistent=True)
 
     def update_alert(self, context: Context) -> None:
         """
@@ -210,6 +235,15 @@ class AR_action(Id_based, Alert_system, Icon_system):
         for macro in self.macros:
             macro.is_playing = value
 
+    def get_has_checkpoint(self) -> bool:
+        return (self.action_type, self.id) in functions.checkpoints
+
+    def get_progress(self) -> float:
+        session = functions.get_session(self.action_type, self.id)
+        if session is None:
+            return 0.0
+        return session.progress
+
     label: StringProperty()
     description: StringProperty(default="Play this Action Button")
     macros: CollectionProperty(type=AR_macro)
@@ -220,17 +254,56 @@ Therefore, the action is executed as many times as there are selected objects.""
                 "STICKY_UVS_DISABLE", 0),
                ("GROUP", "Group",
                 "Performs the current action on all selected objects without separating them (Default Behavior)",
-                "STICKY_UVS_LOC", 1)],
+                "STICKY_UVS_LOC", 1),
+               ("OBJECT", "Per Object",
+                """Performs the whole action on one selected object after another.
+The selection is only changed between the objects, which is much faster for many objects.""",
+                "STICKY_UVS_VERT", 2)],
         name="Execution Mode",
         description="Choses to perform the current actions on the selected objects individually or as a group",
         default="GROUP"
     )
+    playback_mode: EnumProperty(
+        items=[("BLOCKING", "Blocking",
+                "Executes all macros at once, Blender waits until the action is finished (Default Behavior)",
+                "PLAY", 0),
+               ("SLICED", "Sliced",
+                """Executes the macros in short time slices to keep Blender responsive.
+Shows the progress and can be cancelled with Esc""",
+                "TIME", 1)],
+        name="Playback Mode",
+        description="Choses to play the action at once or in time slices",
+        default="BLOCKING"
+    )
+    undo_mode: EnumProperty(
+        items=[("DEFAULT", "Default", "Uses the Undo Mode of the preferences", "PREFERENCES", 0),
+               ("ACTION", "Action",
+                "The whole playback is a single undo step, Ctrl+Z reverts the complete action",
+                "LOOP_BACK", 1),
+               ("MACRO", "Macro", "Every operator macro pushes its own undo step", "UNDO_HISTORY", 2)],
+        name="Undo Mode",
+        description="Choses how the playback of the action is added to the undo history",
+        default="DEFAULT"
+    )
     is_playing: BoolProperty(
         default=False,
         description="Indicates whether the action executes its macros",
         get=get_is_playing,
         set=set_is_playing
     )
+    has_checkpoint: BoolProperty(
+        default=False,
+        description="Indicates whether the last playback of the action failed and can be resumed",
+        get=get_has_checkpoint
+    )
+    progress: FloatProperty(
+        name="Progress",
+        description="Part of the macros which are already executed",
+        subtype='FACTOR',
+        min=0,
+        max=1,
+        get=get_progress
+    )
 
 
 class AR_scene_data(PropertyGroup):  # as Scene PointerProperty
@@ -1,6 +1,28 @@
+from collections import deque
+
 # only mutable types define immutable with BlenderProperties
-render_complete_macros = []
+# format of the elements: (session id, index of the first step after the "Render Complete" step)
+render_complete_macros = deque()
+
+# ring buffer of the tracked operators, the oldest operators are dropped, see functions.resize_tracked_actions
+# format of the elements: (is registered, is undo, bl_idname (interned), properties dict or count of "CONTEXT")
+tracked_actions = deque(maxlen=1024)
+
+# fingerprint of the last converted operator, see functions.get_operator_fingerprint
+operator_fingerprint = None
+# number of scene updates (=value) accessed by the way track_scene handled them (=key)
+tracking_counts = {'serialized': 0, 'unchanged': 0}
+
+# reports of the running recording (record engine "SNAPSHOT"), format of the elements: (report, improved report)
+# the improved report is None for operator reports
+snapshot_reports = []
+# copy of a property (=value) accessed by the source path and attribute of its last report (=key)
+snapshot_cache = {}
+
+# number of Info reports which were already read, see functions.read_new_reports
+report_cursor = 0
 
-tracked_actions = []
+# number of playback sessions which are executing their steps, the scene isn't tracked meanwhile
+playback_depth = 0
 
 data_loaded = False
@@ -13,6 +13,8 @@ from .globals import (
     draw_simple_global_action
 )
 
+from .profiler import draw_profile
+
 
 # region Registration
 def unregister():
@@ -44,7 +44,18 @@ def draw_global_action(layout: UILayout, ActRec_pref: AR_preferences, id: str) -
     op.id = id
     op = row.operator("ar.global_execute_action", text=action.label)
     op.id = id
+    op.profile = ActRec_pref.playback_profile
+    if action.has_checkpoint and not action.is_playing:
+        op = row.operator("ar.global_resume_action", text="", icon='RECOVER_LAST')
+        op.id = id
+    if action.is_playing and action.playback_mode == 'SLICED':
+        row.progress(factor=action.progress, type='RING', text="")
     row.prop(action, 'execution_mode', text="", icon_only=True)
+    row.prop(action, 'playback_mode', text="", icon_only=True)
+    row.prop(action, 'undo_mode', text="", icon_only=True)
+    row.prop(action, 'trigger', text="", icon_only=True)
+    if action.trigger != 'NONE':
+        row.prop(action, 'trigger_interval', text="")
 
 
 def draw_simple_global_action(layout: UILayout, ActRec_pref: AR_preferences, id: str) -> None:
@@ -66,4 +77,5 @@ def draw_simple_global_action(layout: UILayout, ActRec_pref: AR_preferences, id:
         icon_value=action.icon if action.icon else 101
     )
     op.id = id
+    op.profile = ActRec_pref.playback_profile
 # endregion
@@ -0,0 +1,58 @@
+# region Imports
+# external modules
+from typing import TYPE_CHECKING
+
+# blender modules
+from bpy.types import UILayout
+
+# relative imports
+if TYPE_CHECKING:
+    from ..functions.profiler import PlaybackProfile
+else:
+    PlaybackProfile = object
+# endregion
+
+# region UI functions
+
+
+def draw_profile(layout: UILayout, profile: PlaybackProfile, limit: int = 10) -> None:
+    """
+    draws the slowest macros of a profile as table and the export buttons
+
+    Args:
+        layout (UILayout): UI context of Blender
+        profile (PlaybackProfile): profile to draw
+        limit (int, optional): maximum number of drawn macros. Defaults to 10.
+    """
+    row = layout.row()
+    row.label(text="Profile: %.3f s" % profile.total_time, icon='SORTTIME')
+    row = row.row(align=True)
+    op = row.operator("ar.export_profile", text="JSON", icon='EXPORT')
+    op.id = profile.action_id
+    op.action_type = profile.action_type
+    op.file_format = 'JSON'
+    op = row.operator("ar.export_profile", text="CSV")
+    op.id = profile.action_id
+    op.action_type = profile.action_type
+    op.file_format = 'CSV'
+
+    col = layout.column(align=True)
+    row = col.row()
+    split = row.split(factor=0.55)
+    split.label(text="Macro")
+    split = split.split(factor=0.5)
+    split.label(text="Time (ms)")
+    split = split.split(factor=0.5)
+    split.label(text="Calls")
+    split.label(text="Errors")
+    for macro in profile.ranked()[:limit]:
+        row = col.row()
+        row.alert = bool(macro.errors)
+        split = row.split(factor=0.55)
+        split.label(text=macro.label)
+        split = split.split(factor=0.5)
+        split.label(text="%.2f" % ((macro.time + macro.wait_time) * 1000))
+        split = split.split(factor=0.5)
+        split.label(text=str(macro.calls))
+        split.label(text=str(macro.errors))
+# endregion